@@ -1,6 +1,5 @@
 import logging
-import math
-from typing import Optional, Union
+from typing import Union
 
 from geopandas import GeoSeries
 import numpy as np
@@ -70,114 +69,146 @@ def centerline(
         return None
     geometry = _extract_0dim_ndarray(geometry)
 
-    # If input is arraylike, treat every geometry in loop
+    # If input is arraylike, treat all geometries at once
     if hasattr(geometry, "__len__"):
-        result = np.array(
-            [
-                _centerline(
-                    geom=geom,
-                    densify_distance=densify_distance,
-                    min_branch_length=min_branch_length,
-                    simplifytolerance=simplifytolerance,
-                    extend=extend,
-                )
-                for geom in geometry
-            ]
+        result = _centerline(
+            geometries=np.asarray(geometry, dtype=object),
+            densify_distance=densify_distance,
+            min_branch_length=min_branch_length,
+            simplifytolerance=simplifytolerance,
+            extend=extend,
         )
         if isinstance(geometry, GeoSeries):
             result = GeoSeries(result, index=geometry.index, crs=geometry.crs)
         return result
     else:
         return _centerline(
-            geom=geometry,
+            geometries=np.array([geometry]),
             densify_distance=densify_distance,
             min_branch_length=min_branch_length,
             simplifytolerance=simplifytolerance,
             extend=extend,
-        )
+        )[0]
 
 
 def _centerline(
-    geom: Optional[BaseGeometry],
+    geometries: NDArray[BaseGeometry],
     densify_distance: float = -1,
     min_branch_length: float = -1,
     simplifytolerance: float = -0.25,
     extend: bool = False,
-) -> Optional[BaseGeometry]:
-    if geom is None or geom.is_empty:
-        return None
+) -> NDArray[BaseGeometry]:
+    result = np.full(len(geometries), None, dtype=object)
+    to_process = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+    geoms = geometries[to_process]
+    if len(geoms) == 0:
+        return result
+
+    # The average width is only needed if a parameter must be determined automatically
     average_width = None
+    if (
+        densify_distance < 0
+        or min_branch_length < 0
+        or (simplifytolerance is not None and simplifytolerance < 0)
+    ):
+        average_width = _average_width(geoms)
+
     # Densify lines in the input
     if densify_distance != 0:
         max_segment_length = densify_distance
         if densify_distance < 0:
             # Automatically determine length
-            if average_width is None:
-                average_width = _average_width(geom)
             max_segment_length = abs(densify_distance) * average_width
-        geom_densified = shapely.segmentize(geom, max_segment_length)
+        geoms_densified = shapely.segmentize(geoms, max_segment_length)
     else:
-        geom_densified = geom
+        geoms_densified = geoms
 
     # Determine envelope of voronoi + calculate voronoi edges
-    voronoi_edges = shapely.voronoi_polygons(geom_densified, only_edges=True)
+    voronoi_edges = shapely.voronoi_polygons(geoms_densified, only_edges=True)
+
+    # Determine the minimum branch length and the simplify tolerance per geometry
+    min_branch_lengths = np.broadcast_to(min_branch_length, len(geoms))
+    if min_branch_length < 0:
+        # If < 0, calculate
+        min_branch_lengths = abs(min_branch_length) * average_width
+    tolerances = np.broadcast_to(simplifytolerance, len(geoms))
+    if simplifytolerance is not None and simplifytolerance < 0:
+        # Automatically determine tol
+        tolerances = abs(simplifytolerance) * average_width
 
     # Only keep edges that are covered by the original geometry to remove edges
     # going to infinity,...
-    # Remark: contains is optimized for prepared geometries <> within -> a lot faster!
-    edges = shapely.get_parts(voronoi_edges)
-    shapely.prepare(geom)
-    edges = edges[shapely.contains(geom, edges)]
-    if len(edges) == 1:
-        lines = edges[0]
-    elif len(edges) > 1:
-        lines = shapely.line_merge(shapely.multilinestrings(edges))
-    else:
+    # Remark: covers is optimized for prepared geometries <> coveredby -> a lot faster!
+    shapely.prepare(geoms)
+    edges, edges_geom_idx = shapely.get_parts(voronoi_edges, return_index=True)
+    edges_to_keep = shapely.covers(geoms[edges_geom_idx], edges)
+    edges = edges[edges_to_keep]
+    edges_geom_idx = edges_geom_idx[edges_to_keep]
+    nb_edges = np.bincount(edges_geom_idx, minlength=len(geoms))
+
+    # Merge the edges to lines per geometry
+    lines = np.empty(len(geoms), dtype=object)
+    single_edge_mask = nb_edges == 1
+    lines[single_edge_mask] = edges[single_edge_mask[edges_geom_idx]]
+    multi_edge_mask = nb_edges > 1
+    if multi_edge_mask.any():
+        multi_edges_mask = multi_edge_mask[edges_geom_idx]
+        _, multi_edges_idx = np.unique(
+            edges_geom_idx[multi_edges_mask], return_inverse=True
+        )
+        lines[multi_edge_mask] = shapely.line_merge(
+            shapely.multilinestrings(
+                edges[multi_edges_mask], indices=multi_edges_idx.reshape(-1)
+            )
+        )
+    no_edge_mask = nb_edges == 0
+    if no_edge_mask.any():
         # No edges within the polygon, so use intersection
-        voronoi_clipped = shapely.intersection(geom, voronoi_edges)
-        lines = shapely.line_merge(voronoi_clipped)
+        voronoi_clipped = shapely.intersection(
+            geoms[no_edge_mask], voronoi_edges[no_edge_mask]
+        )
+        lines[no_edge_mask] = shapely.line_merge(voronoi_clipped)
 
-    # If min_branch_length != 0, remove short branches
-    min_branch_length_cur = min_branch_length
-    if min_branch_length_cur < 0:
-        # If < 0, calculate
-        if average_width is None:
-            average_width = _average_width(geom)
-        min_branch_length_cur = abs(min_branch_length_cur) * average_width
-    if min_branch_length_cur > 0:
-        lines = _remove_short_branches_notempty(
-            line=lines, min_branch_length=min_branch_length_cur
+    # If min_branch_length != 0, remove short branches. Single lines don't have any.
+    to_clean = (min_branch_lengths > 0) & (
+        shapely.get_type_id(lines) == shapely.GeometryType.MULTILINESTRING
+    )
+    for idx in np.flatnonzero(to_clean):
+        lines[idx] = _remove_short_branches_notempty(
+            line=lines[idx], min_branch_length=min_branch_lengths[idx]
         )
 
     # Simplify if needed
     if simplifytolerance is not None:
-        tol = simplifytolerance
-        if simplifytolerance < 0:
-            # Automatically determine tol
-            if average_width is None:
-                average_width = _average_width(geom)
-            tol = abs(simplifytolerance) * average_width
-        lines = shapely.simplify(lines, tol)
+        lines = shapely.simplify(lines, tolerances)
 
     if extend:
-        lines = _extend_line.extend_line_to_geometry(lines, geom)
+        lines = np.array(
+            [
+                _extend_line.extend_line_to_geometry(line, geom)
+                for line, geom in zip(lines, geoms)
+            ]
+        )
 
     # Return result
-    lines = shapely.normalize(lines)
-    return lines
+    result[to_process] = shapely.normalize(lines)
+    return result
 
 
-def _average_width(geom: BaseGeometry) -> float:
+def _average_width(geometries: NDArray[BaseGeometry]) -> NDArray[np.float64]:
     """
-    Calculate the average width for a polygon.
+    Calculate the average width for polygons.
 
     Args:
-        geom (BaseGeometry): the input polygon
+        geometries (NDArray[BaseGeometry]): the input polygons
 
     Returns:
-        float: the average width
+        NDArray[np.float64]: the average width for each polygon
     """
-    return geom.length / 4 - math.sqrt(max((geom.length / 4) ** 2 - geom.area, 0))
+    quarter_lengths = shapely.length(geometries) / 4
+    return quarter_lengths - np.sqrt(
+        np.maximum(quarter_lengths**2 - shapely.area(geometries), 0)
+    )
 
 
 def _remove_short_branches_notempty(
@@ -243,71 +274,60 @@ def _remove_short_branches(
     # Remove short branches till there are no more short branches
     line_cleaned = shapely.normalize(line)
     while isinstance(line_cleaned, shapely.MultiLineString):
-        # Loop over each line to check if we keep it, ordered by length
-        lines_rtree = None
-        line_parts_to_remove = []
         line_cleaned_parts = shapely.get_parts(line_cleaned)
-        linetuples_sorted = sorted(
-            enumerate(line_cleaned_parts),
-            key=lambda x: shapely.length(x[1]),
+        nb_parts = len(line_cleaned_parts)
+
+        # Determine the start and end point of each line and give each unique point
+        # an id, so the number of lines ending in each point can be counted.
+        coords = shapely.get_coordinates(line_cleaned_parts)
+        end_idxs = np.cumsum(shapely.get_num_coordinates(line_cleaned_parts)) - 1
+        start_idxs = np.concatenate([[0], end_idxs[:-1] + 1])
+        _, point_ids, point_counts = np.unique(
+            np.concatenate([coords[start_idxs], coords[end_idxs]]),
+            axis=0,
+            return_inverse=True,
+            return_counts=True,
         )
-        for line_cur_idx, line_cur in linetuples_sorted:
-            # If the line is long enough, always keep it
-            if line_cur.length >= min_branch_length:
+        point_ids = point_ids.reshape(-1)
+        start_ids = point_ids[:nb_parts]
+        end_ids = point_ids[nb_parts:]
+
+        # Check for the first and last point whether they touch another line. For
+        # closed lines, the start and end point both belong to the line itself.
+        nb_self = np.where(start_ids == end_ids, 2, 1)
+        startpoint_adjacency = point_counts[start_ids] > nb_self
+        endpoint_adjacency = point_counts[end_ids] > nb_self
+
+        # For short lines, a point that isn't the start or end point of another line
+        # can still touch the interior of another line.
+        lengths = shapely.length(line_cleaned_parts)
+        is_short = lengths < min_branch_length
+        lines_rtree = None
+        for adjacency, point_idxs in [
+            (startpoint_adjacency, start_idxs),
+            (endpoint_adjacency, end_idxs),
+        ]:
+            line_to_check_idxs = np.nonzero(is_short & ~adjacency)[0]
+            if len(line_to_check_idxs) == 0:
                 continue
-
-            # Check for the first and last point whether they touch another edge
-            line_cur_coords = shapely.get_coordinates(line_cur)
-            # Check first point
-            search_point = shapely.Point(line_cur_coords[0])
             if lines_rtree is None:
                 lines_rtree = shapely.STRtree(line_cleaned_parts)
-            neighbour_idxs = list(lines_rtree.query(search_point))
-            startpoint_adjacency = False
-
-            # If only one found, it is itself so nothing adjacent.
-            if len(neighbour_idxs) > 1:
-                for neighbour_idx in neighbour_idxs:
-                    # If the near line is itself, skip
-                    if neighbour_idx == line_cur_idx:
-                        continue
-                    # Check if the near line really intersects
-                    if shapely.intersects(
-                        line_cleaned_parts[neighbour_idx], search_point
-                    ):
-                        startpoint_adjacency = True
-                        break
-
-            # Check last point
-            search_point = shapely.Point(line_cur_coords[-1])
-            neighbour_idxs = list(lines_rtree.query(search_point))
-            endpoint_adjacency = False
-
-            # If only one found, it is itself so nothing adjacent.
-            if len(neighbour_idxs) > 1:
-                for neighbour_idx in neighbour_idxs:
-                    # If the near line is itself, skip
-                    if neighbour_idx == line_cur_idx:
-                        continue
-                    # Check if the near line really intersects
-                    if shapely.intersects(
-                        line_cleaned_parts[neighbour_idx], search_point
-                    ):
-                        endpoint_adjacency = True
-                        break
-
-            if startpoint_adjacency is False and endpoint_adjacency is False:
-                # Standalone line, keep it
-                continue
-            elif startpoint_adjacency and endpoint_adjacency:
-                # Line between two others, so keep it
-                continue
-            else:
-                # Only either start or end point has an adjacency: short branch,
-                # so don't keep.
-                line_parts_to_remove.append(line_cur_idx)
-                if remove_one_by_one:
-                    break
+            search_points = shapely.points(coords[point_idxs[line_to_check_idxs]])
+            point_idx, neighbour_idx = lines_rtree.query(
+                search_points, predicate="intersects"
+            )
+            line_cur_idx = line_to_check_idxs[point_idx]
+            adjacency[line_cur_idx[neighbour_idx != line_cur_idx]] = True
+
+        # Short lines with only either the start or the end point having an adjacency
+        # are short branches, so don't keep them. Standalone lines and lines between
+        # two others are kept.
+        is_short_branch = is_short & (startpoint_adjacency != endpoint_adjacency)
+        line_parts_to_remove = np.nonzero(is_short_branch)[0]
+        if remove_one_by_one:
+            # Only remove the shortest short branch
+            parts_sorted = np.argsort(lengths, kind="stable")
+            line_parts_to_remove = parts_sorted[is_short_branch[parts_sorted]][:1]
 
         # Remove the line parts found
         if len(line_parts_to_remove) > 0:
@@ -12,6 +12,16 @@ from shapely.geometry.base import BaseGeometry, BaseMultipartGeometry
 import pygeoops
 from pygeoops._types import GeometryType, PrimitiveType
 
+# The multi GeometryType for the geom_type of each single shapely geometry.
+_GEOM_TYPE_TO_MULTITYPE = {
+    geometrytype.name_camelcase: geometrytype.to_multitype
+    for geometrytype in [
+        GeometryType.POINT,
+        GeometryType.LINESTRING,
+        GeometryType.POLYGON,
+    ]
+}
+
 
 def collect(geometries) -> Optional[BaseGeometry]:
     """
@@ -62,11 +72,13 @@ def collect(geometries) -> Optional[BaseGeometry]:
             result_collection_type = GeometryType.GEOMETRYCOLLECTION
             break
 
-        geometrytype = GeometryType(geom.geom_type)
+        multitype = _GEOM_TYPE_TO_MULTITYPE.get(geom.geom_type)
+        if multitype is None:
+            multitype = GeometryType(geom.geom_type).to_multitype
         if result_collection_type is None:
             # First element
-            result_collection_type = geometrytype.to_multitype
-        elif geometrytype.to_multitype == result_collection_type:
+            result_collection_type = multitype
+        elif multitype == result_collection_type:
             # Same as the previous types encountered, so continue checking
             continue
         else:
@@ -11,7 +11,6 @@ from numpy.typing import NDArray
 import shapely
 from shapely.geometry.base import BaseGeometry, BaseMultipartGeometry
 import shapely.coords
-import pygeoops
 
 try:
     import simplification.cutil as simplification
@@ -97,18 +96,13 @@ def simplify(
 
     # If input is arraylike, apply to all elements
     if hasattr(geometry, "__len__"):
-        result = np.array(
-            [
-                _simplify(
-                    geometry=geom,
-                    tolerance=tolerance,
-                    algorithm=algorithm,
-                    lookahead=lookahead,
-                    preserve_topology=preserve_topology,
-                    keep_points_on=keep_points_on,
-                )
-                for geom in geometry
-            ]
+        result = _simplify_array(
+            geometries=np.asarray(geometry, dtype=object),
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            preserve_topology=preserve_topology,
+            keep_points_on=keep_points_on,
         )
         if isinstance(geometry, GeoSeries):
             result = GeoSeries(result, index=geometry.index, crs=geometry.crs)
@@ -145,19 +139,7 @@ def _simplify(
         )
 
     # Check algorythm
-    simplify_lookahead_points = False
-    if algorithm in ["rdp", "vw"]:
-        if not HAS_SIMPLIFICATION:
-            raise ImportError(
-                "To use simplify_ext using rdp or vw, first install simplification "
-                "with 'pip install simplification'"
-            )
-    elif algorithm == "lang":
-        pass
-    elif "lang+":
-        simplify_lookahead_points = True
-    else:
-        raise ValueError(f"Unsupported algorithm specified: {algorithm}")
+    simplify_lookahead_points = _check_algorithm(algorithm)
 
     # Loop over the rings, and simplify them one by one...
     # If the geometry is None, just return...
@@ -165,7 +147,8 @@ def _simplify(
         # Point or MultiPoint cannot be simplified
         return geometry
     elif isinstance(geometry, shapely.LineString):
-        result_geom = simplify_linestring(
+        # simplify_linestring already takes care of making the result valid if needed
+        return simplify_linestring(
             linestring=geometry,
             tolerance=tolerance,
             algorithm=algorithm,
@@ -175,7 +158,8 @@ def _simplify(
             keep_points_on=keep_points_on,
         )
     elif isinstance(geometry, shapely.Polygon):
-        result_geom = simplify_polygon(
+        # simplify_polygon already takes care of making the result valid if needed
+        return simplify_polygon(
             polygon=geometry,
             tolerance=tolerance,
             algorithm=algorithm,
@@ -184,10 +168,35 @@ def _simplify(
             preserve_topology=preserve_topology,
             keep_points_on=keep_points_on,
         )
+    elif isinstance(geometry, shapely.MultiPolygon):
+        # For a MultiPolygon, simplify all polygons in one batch
+        simplified_geometries = simplify_polygons(
+            shapely.get_parts(geometry),
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            simplify_lookahead_points=simplify_lookahead_points,
+            preserve_topology=preserve_topology,
+            keep_points_on=keep_points_on,
+        )
+        result_geom = _collect(simplified_geometries)
+    elif isinstance(geometry, shapely.MultiLineString):
+        # For a MultiLineString, simplify all linestrings in one batch
+        simplified_geometries = simplify_linestrings(
+            shapely.get_parts(geometry),
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            simplify_lookahead_points=simplify_lookahead_points,
+            preserve_topology=preserve_topology,
+            keep_points_on=keep_points_on,
+        )
+        result_geom = _collect(simplified_geometries)
     elif isinstance(geometry, BaseMultipartGeometry):
         # If it is a multi-part, recursively call simplify for all parts.
-        simplified_geometries = [
-            _simplify(
+        simplified_geometries = np.empty(len(geometry.geoms), dtype=object)
+        for idx, geom in enumerate(geometry.geoms):
+            simplified_geometries[idx] = _simplify(
                 geom,
                 tolerance=tolerance,
                 algorithm=algorithm,
@@ -195,13 +204,112 @@ def _simplify(
                 preserve_topology=preserve_topology,
                 keep_points_on=keep_points_on,
             )
-            for geom in geometry.geoms
-        ]
-        result_geom = general.collect(simplified_geometries)
+        result_geom = _collect(simplified_geometries)
     else:
         raise ValueError(f"Unsupported geometrytype: {geometry}")
 
-    return shapely.make_valid(result_geom)
+    # Only apply make_valid if needed, as it is relatively expensive
+    if not shapely.is_valid(result_geom):
+        result_geom = shapely.make_valid(result_geom)
+
+    return result_geom
+
+
+def _simplify_array(
+    geometries: NDArray[BaseGeometry],
+    tolerance: float,
+    algorithm: str,
+    lookahead: int,
+    preserve_topology: bool,
+    keep_points_on: Optional[BaseGeometry],
+) -> NDArray[BaseGeometry]:
+    """
+    Simplify all geometries in the array.
+
+    LineStrings and Polygons are simplified in batch, other geometries one by one.
+    """
+    simplify_lookahead_points = _check_algorithm(algorithm)
+
+    # Remark: shapely type ids: 1 = LineString, 3 = Polygon
+    result = np.empty(len(geometries), dtype=object)
+    type_ids = shapely.get_type_id(geometries)
+    is_linestring = type_ids == 1
+    is_polygon = type_ids == 3
+    if is_linestring.any():
+        result[is_linestring] = simplify_linestrings(
+            geometries[is_linestring],
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            simplify_lookahead_points=simplify_lookahead_points,
+            preserve_topology=preserve_topology,
+            keep_points_on=keep_points_on,
+        )
+    if is_polygon.any():
+        result[is_polygon] = simplify_polygons(
+            geometries[is_polygon],
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            simplify_lookahead_points=simplify_lookahead_points,
+            preserve_topology=preserve_topology,
+            keep_points_on=keep_points_on,
+        )
+    for idx in np.flatnonzero(~is_linestring & ~is_polygon):
+        result[idx] = _simplify(
+            geometry=geometries[idx],
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            preserve_topology=preserve_topology,
+            keep_points_on=keep_points_on,
+        )
+
+    return result
+
+
+def _check_algorithm(algorithm: str) -> bool:
+    """
+    Check if the algorithm is supported.
+
+    Returns True if the lookahead points should be simplified as well.
+    """
+    if algorithm in ["rdp", "vw"]:
+        if not HAS_SIMPLIFICATION:
+            raise ImportError(
+                "To use simplify_ext using rdp or vw, first install simplification "
+                "with 'pip install simplification'"
+            )
+        return False
+    elif algorithm == "lang":
+        return False
+    elif algorithm == "lang+":
+        return True
+    else:
+        raise ValueError(f"Unsupported algorithm specified: {algorithm}")
+
+
+def _collect(geometries: NDArray[BaseGeometry]) -> Optional[BaseGeometry]:
+    """
+    Collect the simplified parts of a multipart geometry again.
+
+    Typically, all simplified parts are still polygons or linestrings, so they can be
+    collected with the vectorized shapely functions. Otherwise, general.collect is used.
+    """
+    if len(geometries) > 1 and not shapely.is_empty(geometries).any():
+        # Remark: shapely type ids: 1 = LineString, 3 = Polygon
+        type_ids = shapely.get_type_id(geometries)
+        if (type_ids == 3).all():
+            # A multipolygon with touching rings is not valid, so then create a
+            # GeometryCollection like general.collect does.
+            result = shapely.multipolygons(geometries)
+            if not result.is_valid:
+                result = shapely.geometrycollections(geometries)
+            return result
+        elif (type_ids == 1).all():
+            return shapely.multilinestrings(geometries)
+
+    return general.collect(geometries)
 
 
 # Apply the simplification (can result in multipolygons)
@@ -214,10 +322,56 @@ def simplify_polygon(
     preserve_topology: bool,
     keep_points_on: Optional[BaseGeometry],
 ) -> Union[shapely.Polygon, shapely.MultiPolygon, None]:
-    # First simplify exterior ring
-    assert polygon.exterior is not None
-    exterior_simpl = simplify_coords(
-        polygon.exterior.coords,
+    return simplify_polygons(
+        np.array([polygon]),
+        tolerance=tolerance,
+        algorithm=algorithm,
+        lookahead=lookahead,
+        simplify_lookahead_points=simplify_lookahead_points,
+        preserve_topology=preserve_topology,
+        keep_points_on=keep_points_on,
+    )[0]
+
+
+def simplify_polygons(
+    polygons: NDArray[BaseGeometry],
+    tolerance: float,
+    algorithm: str,
+    lookahead: int,
+    simplify_lookahead_points: bool,
+    preserve_topology: bool,
+    keep_points_on: Optional[BaseGeometry],
+) -> NDArray[BaseGeometry]:
+    # Polygons with and without z coordinates cannot be created together, so they are
+    # treated separately.
+    has_z = shapely.has_z(polygons)
+    if has_z.any() and not has_z.all():
+        result = np.empty(len(polygons), dtype=object)
+        for include_z in [False, True]:
+            idx = np.flatnonzero(has_z == include_z)
+            result[idx] = simplify_polygons(
+                polygons[idx],
+                tolerance=tolerance,
+                algorithm=algorithm,
+                lookahead=lookahead,
+                simplify_lookahead_points=simplify_lookahead_points,
+                preserve_topology=preserve_topology,
+                keep_points_on=keep_points_on,
+            )
+        return result
+
+    # Extract the coordinates of all rings of all polygons at once. The first ring of
+    # each polygon is the exterior ring.
+    rings, rings_polygon_idx = shapely.get_rings(polygons, return_index=True)
+    rings_coords = np.split(
+        shapely.get_coordinates(rings, include_z=has_z.any()),
+        np.cumsum(shapely.get_num_coordinates(rings))[:-1],
+    )
+    rings_is_exterior = np.diff(rings_polygon_idx, prepend=-1) != 0
+
+    # Simplify all rings in one batch
+    rings_simpl = simplify_coords_list(
+        rings_coords,
         tolerance=tolerance,
         algorithm=algorithm,
         lookahead=lookahead,
@@ -225,48 +379,102 @@ def simplify_polygon(
         keep_points_on=keep_points_on,
     )
 
-    # If simplify result is None or not enough points
-    if exterior_simpl is None or len(exterior_simpl) < 3:
-        if preserve_topology:
+    # Determine the rings to use in the result. Empty polygons don't have rings: they
+    # stay empty or become None.
+    result_is_none = np.full(len(polygons), not preserve_topology)
+    result_is_none[rings_polygon_idx] = False
+    rings_result: list[Optional[np.ndarray]] = []
+    for ring_coords, ring_simpl, polygon_idx, is_exterior in zip(
+        rings_coords, rings_simpl, rings_polygon_idx, rings_is_exterior
+    ):
+        if len(ring_simpl) >= 3:
+            # If simplified version is ring, use it
+            rings_result.append(ring_simpl)
+        elif preserve_topology:
             # If topology needs to be preserved, keep original ring
-            exterior_simpl = polygon.exterior.coords
+            rings_result.append(ring_coords)
         else:
-            # No use to continue... result is None polygon
-            return None
-
-    # Now simplify interior rings
-    interiors_simpl = []
-    for interior in polygon.interiors:
-        interior_simpl = simplify_coords(
-            coords=interior.coords,
-            tolerance=tolerance,
-            algorithm=algorithm,
-            lookahead=lookahead,
-            simplify_lookahead_points=simplify_lookahead_points,
-            keep_points_on=keep_points_on,
+            # No valid ring anymore. For an exterior ring the result is None polygon.
+            rings_result.append(None)
+            if is_exterior:
+                result_is_none[polygon_idx] = True
+
+    # Create all polygons in one go
+    result = np.array(polygons, dtype=object)
+    result[result_is_none] = None
+    rings_result_idx = [
+        idx
+        for idx, ring in enumerate(rings_result)
+        if ring is not None and not result_is_none[rings_polygon_idx[idx]]
+    ]
+    if len(rings_result_idx) > 0:
+        rings_result_coords = [rings_result[idx] for idx in rings_result_idx]
+        rings_new = shapely.linearrings(
+            np.concatenate(rings_result_coords),
+            indices=np.repeat(
+                np.arange(len(rings_result_coords)),
+                [len(coords) for coords in rings_result_coords],
+            ),
         )
+        polygons_idx, polygons_new_idx = np.unique(
+            rings_polygon_idx[rings_result_idx], return_inverse=True
+        )
+        result[polygons_idx] = shapely.polygons(rings_new, indices=polygons_new_idx)
 
-        # If simplified version is ring, add it
-        if interior_simpl is not None and len(interior_simpl) >= 3:
-            interiors_simpl.append(interior_simpl)
-        elif preserve_topology:
-            # If result is no ring, but topology needs to be preserved,
-            # add original ring
-            interiors_simpl.append(interior.coords)
+    # If results are invalid, try to make them valid + extract only polygons as result
+    invalid_idx = np.flatnonzero(~result_is_none & ~shapely.is_valid(result))
+    if len(invalid_idx) > 0:
+        result[invalid_idx] = _make_valid_polygons(result[invalid_idx])
+
+    # If a result is None and the topology needs to be preserved, return the original
+    # polygon, made valid if needed.
+    if preserve_topology:
+        result_missing = shapely.is_missing(result)
+        result[result_missing] = polygons[result_missing]
+        invalid_idx = np.flatnonzero(result_missing & ~shapely.is_valid(result))
+        if len(invalid_idx) > 0:
+            result[invalid_idx] = shapely.make_valid(result[invalid_idx])
 
-    result_poly = shapely.Polygon(exterior_simpl, interiors_simpl)
+    return result
+
+
+def _make_valid_polygons(geometries: NDArray[BaseGeometry]) -> NDArray[BaseGeometry]:
+    """
+    Make the geometries valid, only retaining the polygons in the result.
 
-    # Extract only polygons as result + try to make valid
-    result_poly = general.collection_extract(
-        shapely.make_valid(result_poly), primitivetype=pygeoops.PrimitiveType.POLYGON
+    This gives the same result as applying make_valid followed by collection_extract,
+    but the polygons are extracted for all geometries at once.
+    """
+    # Get all polygons in the output of make_valid. It can be a GeometryCollection
+    # containing a MultiPolygon, so explode two levels deep.
+    parts, parts_idx = shapely.get_parts(
+        shapely.make_valid(geometries), return_index=True
+    )
+    parts, subparts_idx = shapely.get_parts(parts, return_index=True)
+    parts_idx = parts_idx[subparts_idx]
+    polygons_mask = shapely.get_type_id(parts) == 3
+    polygons = parts[polygons_mask]
+    polygons_idx = parts_idx[polygons_mask]
+
+    result = np.full(len(geometries), None, dtype=object)
+    if len(polygons) == 0:
+        return result
+
+    # Collect the polygons per input geometry. Single polygons are kept as such.
+    result_idx, polygons_result_idx, counts = np.unique(
+        polygons_idx, return_inverse=True, return_counts=True
     )
+    collected = shapely.multipolygons(polygons, indices=polygons_result_idx)
+    is_single = counts == 1
+    collected[is_single] = polygons[(np.cumsum(counts) - counts)[is_single]]
 
-    # If the result is None and the topology needs to be preserved, return
-    # original polygon
-    if preserve_topology and result_poly is None:
-        return polygon
+    # A multipolygon with touching rings is not valid, so then create a
+    # GeometryCollection like general.collect does.
+    for idx in np.flatnonzero(~is_single & ~shapely.is_valid(collected)):
+        collected[idx] = shapely.GeometryCollection(list(collected[idx].geoms))
 
-    return result_poly
+    result[result_idx] = collected
+    return result
 
 
 def simplify_linestring(
@@ -277,30 +485,71 @@ def simplify_linestring(
     simplify_lookahead_points: bool,
     preserve_topology: bool,
     keep_points_on: Optional[BaseGeometry],
-) -> shapely.LineString:
-    # If the linestring cannot be simplified, return it
-    if linestring is None or len(linestring.coords) <= 2:
-        return linestring
-
-    # Simplify
-    coords_simpl = simplify_coords(
-        coords=linestring.coords,
+) -> Optional[BaseGeometry]:
+    return simplify_linestrings(
+        np.array([linestring]),
         tolerance=tolerance,
         algorithm=algorithm,
         lookahead=lookahead,
         simplify_lookahead_points=simplify_lookahead_points,
+        preserve_topology=preserve_topology,
         keep_points_on=keep_points_on,
-    )
+    )[0]
 
-    # If the result is no line anymore
-    if coords_simpl is None or len(coords_simpl) < 2:
-        if preserve_topology:
-            # If preserve_topology is True, return original line
-            return linestring
-        else:
-            return None
 
-    return shapely.LineString(coords_simpl)
+def simplify_linestrings(
+    linestrings: NDArray[BaseGeometry],
+    tolerance: float,
+    algorithm: str,
+    lookahead: int,
+    simplify_lookahead_points: bool,
+    preserve_topology: bool,
+    keep_points_on: Optional[BaseGeometry],
+) -> NDArray[BaseGeometry]:
+    # Linestrings with 2 points or less cannot be simplified, so they are returned as
+    # they are.
+    result = np.array(linestrings, dtype=object)
+    to_simplify = shapely.get_num_coordinates(linestrings) > 2
+
+    # Simplify the coordinates of all linestrings in one batch. Linestrings with and
+    # without z coordinates cannot be created together, so they are treated separately.
+    has_z = shapely.has_z(linestrings)
+    for include_z in np.unique(has_z[to_simplify]):
+        idx = np.flatnonzero(to_simplify & (has_z == include_z))
+        coords_simpl_list = simplify_coords_list(
+            np.split(
+                shapely.get_coordinates(linestrings[idx], include_z=include_z),
+                np.cumsum(shapely.get_num_coordinates(linestrings[idx]))[:-1],
+            ),
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            simplify_lookahead_points=simplify_lookahead_points,
+            keep_points_on=keep_points_on,
+        )
+
+        # If the result is no line anymore, return the original line if the topology
+        # needs to be preserved, otherwise None.
+        nb_coords_simpl = np.array([len(coords) for coords in coords_simpl_list])
+        is_line = nb_coords_simpl >= 2
+        if is_line.any():
+            result[idx[is_line]] = shapely.linestrings(
+                np.concatenate(
+                    [coords for coords, keep in zip(coords_simpl_list, is_line) if keep]
+                ),
+                indices=np.repeat(np.arange(is_line.sum()), nb_coords_simpl[is_line]),
+            )
+        if not preserve_topology:
+            result[idx[~is_line]] = None
+
+    # Only apply make_valid if needed, as it is relatively expensive
+    invalid_idx = np.flatnonzero(
+        ~shapely.is_missing(result) & ~shapely.is_valid(result)
+    )
+    if len(invalid_idx) > 0:
+        result[invalid_idx] = shapely.make_valid(result[invalid_idx])
+
+    return result
 
 
 def simplify_coords(
@@ -313,15 +562,102 @@ def simplify_coords(
 ) -> np.ndarray:
     if isinstance(coords, shapely.coords.CoordinateSequence):
         coords = np.asarray(coords)
+
+    return simplify_coords_list(
+        [coords],
+        tolerance=tolerance,
+        algorithm=algorithm,
+        lookahead=lookahead,
+        simplify_lookahead_points=simplify_lookahead_points,
+        keep_points_on=keep_points_on,
+    )[0]
+
+
+def simplify_coords_list(
+    coords_list: list[np.ndarray],
+    tolerance: float,
+    algorithm: str,
+    lookahead: int,
+    simplify_lookahead_points: bool,
+    keep_points_on: Optional[BaseGeometry],
+) -> list[np.ndarray]:
     # Determine the indexes of the coordinates to keep after simplification
+    coords_to_keep_idx_list = [
+        _simplify_coords_idx(
+            coords,
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            simplify_lookahead_points=simplify_lookahead_points,
+        )
+        for coords in coords_list
+    ]
+
+    if keep_points_on is not None:
+        # Check if there are coordinates that would be removed that should be kept.
+        # This check is done for the coordinates in all arrays at once.
+        coords_to_drop_idx_list = []
+        for coords, coords_to_keep_idx in zip(coords_list, coords_to_keep_idx_list):
+            coords_to_drop_mask = np.ones(len(coords), dtype="bool")
+            coords_to_drop_mask[coords_to_keep_idx] = False
+            coords_to_drop_idx_list.append(coords_to_drop_mask.nonzero()[0])
+
+        coords_to_drop = np.concatenate(
+            [
+                coords[coords_to_drop_idx]
+                for coords, coords_to_drop_idx in zip(
+                    coords_list, coords_to_drop_idx_list
+                )
+            ]
+        )
+        # Use intersects_xy on the prepared geometry so no point geometries need to be
+        # created for the coordinates.
+        shapely.prepare(keep_points_on)
+        coords_to_drop_onborder_list = np.split(
+            shapely.intersects_xy(
+                keep_points_on, coords_to_drop[:, 0], coords_to_drop[:, 1]
+            ),
+            np.cumsum([len(idx) for idx in coords_to_drop_idx_list])[:-1],
+        )
+
+        # Add the coordinates that need to be kept to the coordinates to keep
+        for i, coords_to_drop_onborder in enumerate(coords_to_drop_onborder_list):
+            if not coords_to_drop_onborder.any():
+                continue
+            coords_to_keep_idx = np.concatenate(
+                [
+                    coords_to_keep_idx_list[i],
+                    coords_to_drop_idx_list[i][coords_to_drop_onborder],
+                ],
+                dtype=np.int64,
+            )
+            # Indexes of coordinates to keep need to be sorted
+            coords_to_keep_idx_list[i] = np.sort(coords_to_keep_idx)
+
+    # Extracts coordinates that need to be kept
+    return [
+        coords[coords_to_keep_idx]
+        for coords, coords_to_keep_idx in zip(coords_list, coords_to_keep_idx_list)
+    ]
+
+
+def _simplify_coords_idx(
+    coords: np.ndarray,
+    tolerance: float,
+    algorithm: str,
+    lookahead: int,
+    simplify_lookahead_points: bool,
+):
+    # The simplification library doesn't support batch processing of multiple lines,
+    # so the indexes are determined per coordinate array.
     if algorithm == "rdp":
-        coords_simplify_idx = simplification.simplify_coords_idx(coords, tolerance)
+        return simplification.simplify_coords_idx(coords, tolerance)
     elif algorithm == "vw":
         # The simplification library also has a topology preserving variant of vw, but
         # it doesn't support returning indexes, so is not used.
-        coords_simplify_idx = simplification.simplify_coords_vw_idx(coords, tolerance)
+        return simplification.simplify_coords_vw_idx(coords, tolerance)
     elif algorithm in ["lang", "lang+"]:
-        coords_simplify_idx = simplify_lang.simplify_coords_lang_idx(
+        return simplify_lang.simplify_coords_lang_idx(
             coords=coords,
             tolerance=tolerance,
             lookahead=lookahead,
@@ -329,26 +665,3 @@ def simplify_coords(
         )
     else:
         raise ValueError(f"Unsupported algorithm specified: {algorithm}")
-
-    coords_to_drop_onborder_idx = []
-    if keep_points_on is not None:
-        # Check if there are coordinates that would be removed that should be kept
-        shapely.prepare(keep_points_on)
-        coords_to_drop_mask = np.ones(len(coords), dtype="bool")
-        coords_to_drop_mask[coords_simplify_idx] = False
-        coords_to_drop_idx = coords_to_drop_mask.nonzero()[0]
-
-        coords_to_drop_points = shapely.points(coords[coords_to_drop_idx])
-        coords_to_drop_onborder = keep_points_on.intersects(coords_to_drop_points)
-        coords_to_drop_onborder_idx = coords_to_drop_idx[coords_to_drop_onborder]
-
-    # Extracts coordinates that need to be kept
-    coords_to_keep_idx = coords_simplify_idx
-    if len(coords_to_drop_onborder_idx) > 0:
-        coords_to_keep_idx = np.concatenate(
-            [coords_to_keep_idx, coords_to_drop_onborder_idx], dtype=np.int64
-        )
-        # Indexes of coordinates to keep need to be sorted
-        coords_to_keep_idx = np.sort(coords_to_keep_idx)
-
-    return coords[coords_to_keep_idx]
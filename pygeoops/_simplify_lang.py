@@ -1,13 +1,23 @@
 import logging
-import math
 from typing import Union
 
 import numpy as np
 import shapely
 import shapely.coords
 
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+# Minimum number of points in a window to check distances vectorized. For smaller
+# windows the overhead of the numpy calls is larger than the gain.
+_MIN_WINDOW_POINTS_VECTORIZED = 8
+
 
 def simplify_coords_lang(
     coords: Union[np.ndarray, list, shapely.coords.CoordinateSequence],
@@ -97,12 +107,7 @@ def simplify_coords_lang_idx(
         otherwise returns a list.
     """
     # Init variables
-    if isinstance(coords, np.ndarray):
-        line_arr = coords
-    elif isinstance(coords, shapely.coords.CoordinateSequence):
-        line_arr = np.asarray(coords)
-    else:
-        line_arr = np.array(list(coords))
+    line_arr = np.asarray(coords, dtype=np.float64)
 
     # Prepare lookahead
     nb_points = len(line_arr)
@@ -111,28 +116,155 @@ def simplify_coords_lang_idx(
     else:
         window_size = min(lookahead, nb_points - 1)
 
-    mask_idx_to_keep = np.ones(nb_points, dtype="bool")
+    # If the first window already covers the entire line and all points are within
+    # tolerance, only the first and last point need to be kept.
+    if nb_points <= 2:
+        idx_to_keep_arr = np.arange(nb_points)
+    else:
+        # Use separate, contiguous arrays for the x and y coordinates
+        xs = np.ascontiguousarray(line_arr[:, 0])
+        ys = np.ascontiguousarray(line_arr[:, 1])
+        if window_size == nb_points - 1 and _all_points_in_tolerance(xs, ys, tolerance):
+            idx_to_keep_arr = np.array([0, nb_points - 1])
+        elif HAS_NUMBA:
+            idx_to_keep_arr = _simplify_coords_lang_idx_compiled(
+                xs, ys, float(tolerance), window_size, simplify_lookahead_points
+            )
+        else:
+            idx_to_keep_arr = _simplify_coords_lang_idx(
+                xs,
+                ys,
+                tolerance=tolerance,
+                window_size=window_size,
+                simplify_lookahead_points=simplify_lookahead_points,
+            )
+
+    # If input was np.ndarray, return np.ndarray, otherwise list
+    if isinstance(coords, (np.ndarray, shapely.coords.CoordinateSequence)):
+        return idx_to_keep_arr
+    else:
+        return idx_to_keep_arr.tolist()
+
+
+def _all_points_in_tolerance(xs: np.ndarray, ys: np.ndarray, tolerance: float) -> bool:
+    """
+    Check if all points are within tolerance of the line (first point, last point).
+    """
+    x1 = xs[0].item()
+    y1 = ys[0].item()
+    dx = xs[-1].item() - x1
+    dy = ys[-1].item() - y1
+    segment_length_sq = dx * dx + dy * dy
+    if segment_length_sq == 0:
+        # First and last point are the same, so the distance is infinite
+        return False
+
+    # Compare the squared distances * the squared segment length with the tolerance.
+    max_cross_sq = tolerance * abs(tolerance) * segment_length_sq
+    if len(xs) - 2 < _MIN_WINDOW_POINTS_VECTORIZED:
+        for x, y in zip(xs[1:-1].tolist(), ys[1:-1].tolist()):
+            cross = dx * (y1 - y) - (x1 - x) * dy
+            if cross * cross > max_cross_sq:
+                return False
+        return True
+
+    cross = dx * (y1 - ys[1:-1]) - (x1 - xs[1:-1]) * dy
+    return not (cross * cross > max_cross_sq).any()
+
+
+def _simplify_coords_lang_idx(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    tolerance: float,
+    window_size: int,
+    simplify_lookahead_points: bool,
+) -> np.ndarray:
+    nb_points = len(xs)
     window_start = 0
     window_end = window_size
 
+    # For the standard lang algorithm, the points to keep are collected in a list. If
+    # the lookahead points are simplified as well, points that were retained can be
+    # removed again later on, so a mask is used.
+    idx_to_keep = [0]
+    mask_idx_to_keep = np.ones(
+        nb_points if simplify_lookahead_points else 0, dtype=bool
+    )
+
+    # The distances are compared squared to avoid having to calculate square roots. For
+    # large windows, they are calculated vectorized. For a negative tolerance, all
+    # points must be considered outside tolerance.
+    tolerance_sq = tolerance * abs(tolerance)
+
+    # The coordinates of window_start and the coordinates of the points in the window
+    # relative to window_start only change when window_start moves, so they are cached
+    # while window_end shrinks.
+    cached_window_start = -1
+    x1 = y1 = 0.0
+    x_offsets = y_offsets = xs[:0]
+
+    # Buffers for the vectorized calculations, allocated when needed and then reused
+    # for all windows to avoid memory allocations per window.
+    buffers = None
+    x_offsets_buf = y_offsets_buf = cross_buf = cross_tmp_buf = xs[:0]
+
+    # Accessing elements of python lists is a lot faster than accessing numpy array
+    # elements, and calculating with python floats is faster than with numpy scalars.
+    xs_list = xs.tolist()
+    ys_list = ys.tolist()
+
     # Apply simplification till the window_start arrives at the last point.
     while True:
+        if cached_window_start != window_start:
+            x1 = xs_list[window_start]
+            y1 = ys_list[window_start]
+            x_offsets = y_offsets = xs[:0]
+            cached_window_start = window_start
+        x2 = xs_list[window_end]
+        y2 = ys_list[window_end]
+
         # Check if all points between window_start and window_end are within
         # tolerance distance to the line (window_start, window_end).
-        points_outside_tolerance_found = False
-        for i in range(window_start + 1, window_end):
-            distance = _point_line_distance(
-                line_arr[i, 0],
-                line_arr[i, 1],
-                line_arr[window_start, 0],
-                line_arr[window_start, 1],
-                line_arr[window_end, 0],
-                line_arr[window_end, 1],
+        dx = x2 - x1
+        dy = y2 - y1
+        segment_length_sq = dx * dx + dy * dy
+        max_cross_sq = tolerance_sq * segment_length_sq
+        nb_window_points = window_end - window_start - 1
+        if segment_length_sq == 0:
+            # Window start and end point are the same, so the distance is infinite
+            points_outside_tolerance_found = nb_window_points > 0
+        elif nb_window_points < _MIN_WINDOW_POINTS_VECTORIZED:
+            points_outside_tolerance_found = False
+            for i in range(window_start + 1, window_end):
+                cross = dx * (y1 - ys_list[i]) - (x1 - xs_list[i]) * dy
+                if cross * cross > max_cross_sq:
+                    points_outside_tolerance_found = True
+                    break
+        else:
+            if buffers is None:
+                buffers = np.empty((4, nb_points - 2))
+                x_offsets_buf, y_offsets_buf, cross_buf, cross_tmp_buf = buffers
+            if len(x_offsets) < nb_window_points:
+                x_offsets = np.subtract(
+                    x1,
+                    xs[window_start + 1 : window_end],
+                    out=x_offsets_buf[:nb_window_points],
+                )
+                y_offsets = np.subtract(
+                    y1,
+                    ys[window_start + 1 : window_end],
+                    out=y_offsets_buf[:nb_window_points],
+                )
+
+            # The squared orthogonal distances * the squared segment length
+            cross = np.multiply(
+                dx, y_offsets[:nb_window_points], out=cross_buf[:nb_window_points]
             )
-            # If distance is nan (= linepoint1 == linepoint2) or > tolerance
-            if distance > tolerance:
-                points_outside_tolerance_found = True
-                break
+            cross -= np.multiply(
+                x_offsets[:nb_window_points], dy, out=cross_tmp_buf[:nb_window_points]
+            )
+            cross *= cross
+            points_outside_tolerance_found = bool(cross.max() > max_cross_sq)
 
         # If there were points found outside tolerance distance, we make window smaller
         if points_outside_tolerance_found:
@@ -143,8 +275,8 @@ def simplify_coords_lang_idx(
             # window_start.
             if not simplify_lookahead_points:
                 # In the standard lang implementation the next window always starts with
-                # the end point of the previous window.
-                mask_idx_to_keep[window_start + 1 : window_end] = False
+                # the end point of the previous window, so it is kept.
+                idx_to_keep.append(window_end)
                 window_start = window_end
             else:
                 # To be able to also mask the "lookahead points", this code path doesn't
@@ -179,47 +311,88 @@ def simplify_coords_lang_idx(
             if window_end >= nb_points:
                 window_end = nb_points - 1
 
-    # Prepare result: convert the mask to a list of indices of points to keep.
-    idx_to_keep_arr = mask_idx_to_keep.nonzero()[0]
+    # Prepare result: the indices of the points to keep.
+    if simplify_lookahead_points:
+        return mask_idx_to_keep.nonzero()[0]
+    return np.array(idx_to_keep)
 
-    # If input was np.ndarray, return np.ndarray, otherwise list
-    if isinstance(coords, (np.ndarray, shapely.coords.CoordinateSequence)):
-        return idx_to_keep_arr
-    else:
-        return idx_to_keep_arr.tolist()
 
+def _simplify_coords_lang_idx_scalar(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    tolerance: float,
+    window_size: int,
+    simplify_lookahead_points: bool,
+) -> np.ndarray:
+    """
+    Scalar implementation of the lang algorithm, meant to be compiled with numba.
 
-def _point_line_distance(
-    point_x: float,
-    point_y: float,
-    line_x1: float,
-    line_y1: float,
-    line_x2: float,
-    line_y2: float,
-) -> float:
+    Apart from only using scalar operations, the implementation is the same as
+    _simplify_coords_lang_idx.
     """
-    Calculate the orthogonal distance between the point and line specified.
+    nb_points = len(xs)
+    window_start = 0
+    window_end = window_size
 
-    Args:
-        point_x (float): x coordinate of the point
-        point_y (float): y coordinate of the point
-        line_x1 (float): x coordinate of the 1st point of the line
-        line_y1 (float): y coordinate of the 1st point of the line
-        line_x2 (float): x coordinate of the 2nd point of the line
-        line_y2 (float): y coordinate of the 2nd point of the line
+    # For the standard lang algorithm, the points to keep are collected in an array. If
+    # the lookahead points are simplified as well, a mask is used.
+    idx_to_keep = np.empty(nb_points, dtype=np.int64)
+    idx_to_keep[0] = 0
+    nb_idx_to_keep = 1
+    mask_idx_to_keep = np.ones(nb_points if simplify_lookahead_points else 0, np.bool_)
 
-    Returns:
-        float: the orthogonal distance.
-    """
-    denominator = math.sqrt(
-        (line_x2 - line_x1) * (line_x2 - line_x1)
-        + (line_y2 - line_y1) * (line_y2 - line_y1)
+    # The distances are compared squared to avoid having to calculate square roots.
+    tolerance_sq = tolerance * abs(tolerance)
+
+    # Apply simplification till the window_start arrives at the last point.
+    while True:
+        # Check if all points between window_start and window_end are within
+        # tolerance distance to the line (window_start, window_end).
+        x1 = xs[window_start]
+        y1 = ys[window_start]
+        dx = xs[window_end] - x1
+        dy = ys[window_end] - y1
+        segment_length_sq = dx * dx + dy * dy
+        max_cross_sq = tolerance_sq * segment_length_sq
+        if segment_length_sq == 0:
+            # Window start and end point are the same, so the distance is infinite
+            points_outside_tolerance_found = window_end - window_start > 1
+        else:
+            # Check all points in the loop without branching on the segment length
+            points_outside_tolerance_found = False
+            for i in range(window_start + 1, window_end):
+                cross = dx * (y1 - ys[i]) - (x1 - xs[i]) * dy
+                if cross * cross > max_cross_sq:
+                    points_outside_tolerance_found = True
+                    break
+
+        # If there were points found outside tolerance distance, we make window smaller
+        if points_outside_tolerance_found:
+            window_end -= 1
+        else:
+            # No point outside tolerance found, so mask points in window and move
+            # window_start. More info in _simplify_coords_lang_idx.
+            if not simplify_lookahead_points:
+                idx_to_keep[nb_idx_to_keep] = window_end
+                nb_idx_to_keep += 1
+                window_start = window_end
+            elif not mask_idx_to_keep[window_start + 1 : window_end].any():
+                window_start = window_end
+            else:
+                mask_idx_to_keep[window_start + 1 : window_end] = False
+
+            if window_start >= nb_points - 1 or window_end >= nb_points - 1:
+                break
+            window_end += window_size
+            if window_end >= nb_points:
+                window_end = nb_points - 1
+
+    if simplify_lookahead_points:
+        return mask_idx_to_keep.nonzero()[0]
+    return idx_to_keep[:nb_idx_to_keep]
+
+
+if HAS_NUMBA:
+    _simplify_coords_lang_idx_compiled = numba.njit(cache=True, nogil=True)(
+        _simplify_coords_lang_idx_scalar
     )
-    if denominator == 0:
-        return float("Inf")
-    else:
-        numerator = abs(
-            (line_x2 - line_x1) * (line_y1 - point_y)
-            - (line_x1 - point_x) * (line_y2 - line_y1)
-        )
-        return numerator / denominator
@@ -2,7 +2,10 @@
 Module containing utilities regarding operations on geoseries.
 """
 
+import concurrent.futures
+import itertools
 import logging
+import os
 from typing import Optional, Union
 import warnings
 
@@ -14,12 +17,17 @@ from shapely.geometry.base import BaseGeometry
 import topojson
 
 import pygeoops
-from pygeoops import GeometryType, PrimitiveType
+from pygeoops import PrimitiveType
 from pygeoops._general import _extract_0dim_ndarray
 
 # Get a logger...
 logger = logging.getLogger(__name__)
 
+# Minimum number of arcs in a topology to simplify them in parallel.
+_MIN_ARCS_PARALLEL = 2000
+# Minimum number of arcs per batch when simplifying in parallel.
+_MIN_ARCS_PER_BATCH = 500
+
 
 def simplify_topo(
     geometry,
@@ -68,6 +76,25 @@ def simplify_topo(
             keep_points_on=keep_points_on,
         )
 
+    # If no geometry has more than 2 coordinates (e.g. only points or straight lines),
+    # no points can be removed. If none of the geometries intersect each other, there
+    # are no common boundaries to retain. In both cases creating a topology is useless.
+    geometries_arr = np.asarray(geometry, dtype=object)
+    if (shapely.get_num_coordinates(geometries_arr) <= 2).all() or _disjoint(
+        geometries_arr
+    ):
+        result = pygeoops.simplify(
+            geometry=geometries_arr,
+            tolerance=tolerance,
+            algorithm=algorithm,
+            lookahead=lookahead,
+            preserve_topology=True,
+            keep_points_on=keep_points_on,
+        )
+        if isinstance(geometry, GeoSeries):
+            result = GeoSeries(result, index=geometry.index, crs=geometry.crs)
+        return result
+
     # Create topologies
     # -----------------
     # If the input is no Geoseries or list, convert it to a list as the topojson library
@@ -85,18 +112,27 @@ def simplify_topo(
 
     # Simplify all arcs/vectors/boundaries of the topologies
     # ------------------------------------------------------
-    topolines = shapely.MultiLineString(topo.output["arcs"])
-
-    # If the algorithm is rdp and no keep_points_on, use shapely
-    if algorithm == "rdp" and keep_points_on is None:
-        topolines_simpl = shapely.MultiLineString(
-            shapely.simplify(
-                geometry=shapely.get_parts(topolines),
-                tolerance=tolerance,
-                preserve_topology=True,
-            ).tolist()
-        )
-    else:
+    # Remark: the arcs are converted to linestrings in bulk from one coordinate array,
+    # which is a lot faster than creating them one by one.
+    arcs = topo.output["arcs"]
+    nb_coords = np.fromiter(map(len, arcs), dtype=np.intp, count=len(arcs))
+    coords = np.array(
+        list(itertools.chain.from_iterable(arcs)), dtype=np.float64
+    ).reshape(-1, 2)
+    topolines = shapely.linestrings(
+        coords, indices=np.repeat(np.arange(len(arcs)), nb_coords)
+    )
+
+    # If there are many arcs, simplify them in parallel in batches: one per CPU, but
+    # not smaller than _MIN_ARCS_PER_BATCH. If the algorithm is rdp and there are no
+    # keep_points_on, shapely is used for all arcs in one batch.
+    nb_workers = 1
+    if (algorithm != "rdp" or keep_points_on is not None) and len(
+        topolines
+    ) >= _MIN_ARCS_PARALLEL:
+        nb_workers = min(os.cpu_count() or 1, len(topolines) // _MIN_ARCS_PER_BATCH)
+
+    if nb_workers <= 1:
         topolines_simpl = pygeoops.simplify(
             geometry=topolines,
             tolerance=tolerance,
@@ -105,62 +141,224 @@ def simplify_topo(
             keep_points_on=keep_points_on,
             preserve_topology=True,
         )
-    assert topolines_simpl is not None
-    assert isinstance(topolines_simpl, BaseGeometry)
+    else:
+        # Most shapely functions and the compiled lang implementation release the GIL.
+        # Prepare keep_points_on upfront so the threads don't all try to prepare it.
+        if keep_points_on is not None:
+            shapely.prepare(keep_points_on)
+        futures = {}
+        with concurrent.futures.ThreadPoolExecutor(nb_workers) as pool:
+            for idx, topolines_batch in enumerate(
+                np.array_split(topolines, nb_workers)
+            ):
+                future = pool.submit(
+                    pygeoops.simplify,
+                    geometry=topolines_batch,
+                    tolerance=tolerance,
+                    algorithm=algorithm,
+                    lookahead=lookahead,
+                    keep_points_on=keep_points_on,
+                    preserve_topology=True,
+                )
+                futures[future] = idx
+
+            topolines_simpl_batches = [None] * nb_workers
+            for future in concurrent.futures.as_completed(futures):
+                topolines_simpl_batches[futures[future]] = future.result()
+        topolines_simpl = np.concatenate(topolines_simpl_batches)
+    assert isinstance(topolines_simpl, np.ndarray)
 
     # Copy the results of the simplified lines back to the topology arcs
+    # Remark: the coordinates of all lines are fetched at once and the arcs are sliced
+    # from them, which is a lot faster than accessing the coordinates per line.
+    nb_coords_simpl = shapely.get_num_coordinates(topolines_simpl)
+    coords_simpl_ends = np.cumsum(nb_coords_simpl)
+    coords_simpl_starts = coords_simpl_ends - nb_coords_simpl
+    coords_simpl = shapely.get_coordinates(topolines_simpl)
     if algorithm in ["lang", "lang+"]:
-        # For LANG, a simple copy is OK
-        assert isinstance(topolines_simpl, shapely.MultiLineString)
-        topo.output["arcs"] = [list(geom.coords) for geom in topolines_simpl.geoms]
+        # For LANG, all lines can be copied
+        arcs_simpl_idx = np.arange(len(arcs))
     else:
-        # For rdp, only overwrite the lines that have a valid result
-        for index in range(len(topo.output["arcs"])):
-            # If the result of the simplify is a point, keep original
-            topoline_simpl = topolines_simpl.geoms[index].coords
-            if len(topoline_simpl) < 2:
-                continue
-            elif (
-                list(topoline_simpl[0]) != topo.output["arcs"][index][0]
-                or list(topoline_simpl[-1]) != topo.output["arcs"][index][-1]
-            ):
-                # Start or end point of the simplified version is not the same anymore
-                continue
-            else:
-                topo.output["arcs"][index] = list(topoline_simpl)
+        # For rdp, only overwrite the lines that have a valid result: if the result of
+        # the simplify is a point or if the start or end point of the simplified version
+        # is not the same anymore, keep the original.
+        coords_ends = np.cumsum(nb_coords)
+        valid_idx = np.flatnonzero(nb_coords_simpl >= 2)
+        same_start = (
+            coords_simpl[coords_simpl_starts[valid_idx]]
+            == coords[(coords_ends - nb_coords)[valid_idx]]
+        ).all(axis=1)
+        same_end = (
+            coords_simpl[coords_simpl_ends[valid_idx] - 1]
+            == coords[coords_ends[valid_idx] - 1]
+        ).all(axis=1)
+        arcs_simpl_idx = valid_idx[same_start & same_end]
+
+    coords_simpl_list = coords_simpl.tolist()
+    for index, start, end in zip(
+        arcs_simpl_idx.tolist(),
+        coords_simpl_starts[arcs_simpl_idx].tolist(),
+        coords_simpl_ends[arcs_simpl_idx].tolist(),
+    ):
+        arcs[index] = coords_simpl_list[start:end]
 
     # Convert the simplified topologies back to geometries
     # ----------------------------------------------------
-    crs = None
-    if isinstance(geometry, GeoSeries):
-        crs = geometry.crs
-    topo_simpl_gdf = topo.to_gdf(crs=crs)
-    topo_simpl_gdf.geometry = topo_simpl_gdf.geometry.make_valid()
+    # Remark: GeoPandas is only used at the end, to avoid its overhead.
+    topo_geoms = _topology_to_geometries(topo)
+    if topo_geoms is not None:
+        geoms_simpl, geoms_simpl_index = topo_geoms
+    else:
+        topo_simpl_gdf = topo.to_gdf()
+        geoms_simpl = topo_simpl_gdf.geometry.array.to_numpy()
+        geoms_simpl_index = topo_simpl_gdf.index
+
+    # Only apply make_valid on invalid geometries, as it is relatively expensive
+    geoms_simpl_invalid = ~shapely.is_valid(geoms_simpl) & ~shapely.is_missing(
+        geoms_simpl
+    )
+    if geoms_simpl_invalid.any():
+        geoms_simpl[geoms_simpl_invalid] = shapely.make_valid(
+            geoms_simpl[geoms_simpl_invalid]
+        )
 
     # If the input was of a single geometry type, filter the result so it stays that way
     # ----------------------------------------------------------------------------------
-    if isinstance(geometry, GeoSeries):
-        types_orig = geometry.geom_type.unique()
-    else:
-        types_orig = np.unique(shapely.get_type_id(geometry))
-    try:
-        primitive_types_orig = list(
-            {GeometryType(type).to_primitivetype.name for type in types_orig}
-        )
-    except Exception:
-        # Geometry or GeometryCollection don't have a primitive type, so exception is
-        # thrown. In this case all geometry types are OK, so don't filter the result.
-        primitive_types_orig = None
-
-    if primitive_types_orig is not None and len(primitive_types_orig) == 1:
-        # Extract only the desired type from simplified output
-        topo_simpl_gdf.geometry = pygeoops.collection_extract(
-            topo_simpl_gdf.geometry, PrimitiveType(primitive_types_orig[0])
+    # Remark: missing geometries and GeometryCollections get primitive type id 0. In
+    # this case all geometry types are OK, so don't filter the result.
+    primitivetype_ids = np.asarray(pygeoops.get_primitivetype_id(geometry))
+    if primitivetype_ids[0] != 0 and (primitivetype_ids == primitivetype_ids[0]).all():
+        # Extract only the desired type from simplified output. Only geometries with
+        # another primitive type need to be processed.
+        geoms_simpl_to_extract = ~shapely.is_missing(geoms_simpl) & (
+            pygeoops.get_primitivetype_id(geoms_simpl) != primitivetype_ids[0]
         )
+        if geoms_simpl_to_extract.any():
+            geoms_simpl[geoms_simpl_to_extract] = pygeoops.collection_extract(
+                geoms_simpl[geoms_simpl_to_extract],
+                PrimitiveType(primitivetype_ids[0]),
+            )
 
     # Return result in the appropriate type
     # -------------------------------------
     if isinstance(geometry, GeoSeries):
-        return topo_simpl_gdf.geometry
+        return GeoSeries(
+            geoms_simpl, index=geoms_simpl_index, crs=geometry.crs, name="geometry"
+        )
+    else:
+        return geoms_simpl
+
+
+def _disjoint(geometries: NDArray[BaseGeometry]) -> bool:
+    """Returns True if none of the geometries intersect each other."""
+    tree = shapely.STRtree(geometries)
+    input_idx, tree_idx = tree.query(geometries, predicate="intersects")
+    return bool((input_idx == tree_idx).all())
+
+
+# Number of offset arrays shapely.from_ragged_array needs per geometry type.
+_RAGGED_NB_OFFSETS = {
+    "LineString": 1,
+    "MultiLineString": 2,
+    "Polygon": 2,
+    "MultiPolygon": 3,
+}
+
+
+def _topology_to_geometries(
+    topo: topojson.Topology,
+) -> Optional[tuple[NDArray[BaseGeometry], list]]:
+    """
+    Convert the (Multi)LineStrings and (Multi)Polygons of a topology to geometries.
+
+    The geometries are reconstructed directly from the arcs of the topology with
+    `shapely.from_ragged_array`, which is a lot faster than `Topology.to_gdf` as this
+    serializes the topology to GeoJSON first. The coordinates are assembled in the same
+    way as in `Topology.to_gdf`.
+
+    Args:
+        topo (topojson.Topology): the topology to convert.
+
+    Returns:
+        Optional[tuple[NDArray[BaseGeometry], list]]: the geometries and the ids of
+            the features. None if the topology contains features that are not
+            supported.
+    """
+    features = topo.output["objects"]["data"]["geometries"]
+    if any(feature["type"] not in _RAGGED_NB_OFFSETS for feature in features):
+        return None
+    arcs = [np.asarray(arc, dtype=np.float64) for arc in topo.output["arcs"]]
+    if any(arc.ndim != 2 or arc.shape[1] != 2 for arc in arcs):
+        return None
+
+    def line_coords(arc_ids: list[int], geom_type: str) -> NDArray[np.float64]:
+        # Consecutive arcs share their end and start point, so only keep it once.
+        coords = np.concatenate(
+            [
+                (arcs[arc_id] if arc_id >= 0 else arcs[~arc_id][::-1])[idx > 0 :]
+                for idx, arc_id in enumerate(arc_ids)
+            ]
+        )
+        min_nb_coords = 3 if geom_type in ("Polygon", "MultiPolygon") else 2
+        if len(coords) < min_nb_coords:
+            coords = np.concatenate([coords, coords[:1]])
+        return coords
+
+    # Gather the coordinates and the offsets per geometry type.
+    geoms_simpl = np.empty(len(features), dtype=object)
+    for geom_type, nb_offsets in _RAGGED_NB_OFFSETS.items():
+        features_idx = [
+            idx for idx, feature in enumerate(features) if feature["type"] == geom_type
+        ]
+        if len(features_idx) == 0:
+            continue
+
+        # Normalize the nested arc id lists so all geometry types have the same depth:
+        # a list of parts, each containing a list of lines, each a list of arc ids.
+        coords_parts = []
+        line_offsets, part_offsets, geom_offsets = [0], [0], [0]
+        for idx in features_idx:
+            parts = features[idx]["arcs"]
+            if geom_type == "LineString":
+                parts = [[parts]]
+            elif geom_type in ("MultiLineString", "Polygon"):
+                parts = [parts]
+            for part in parts:
+                for line_arc_ids in part:
+                    nb_coords = 0
+                    if len(line_arc_ids) > 0:
+                        coords_parts.append(line_coords(line_arc_ids, geom_type))
+                        nb_coords = len(coords_parts[-1])
+                    line_offsets.append(line_offsets[-1] + nb_coords)
+                part_offsets.append(len(line_offsets) - 1)
+            geom_offsets.append(len(part_offsets) - 1)
+        offsets = (line_offsets, part_offsets, geom_offsets)[:nb_offsets]
+
+        coords = np.concatenate(coords_parts) if coords_parts else np.empty((0, 2))
+        geoms_simpl[features_idx] = shapely.from_ragged_array(
+            shapely.GeometryType[geom_type.upper()],
+            coords,
+            tuple(np.asarray(offset, dtype=np.int64) for offset in offsets),
+        )
+
+    # Apply the same winding order as `Topology.to_gdf`
+    if hasattr(shapely, "orient_polygons"):
+        geoms_simpl = shapely.orient_polygons(geoms_simpl, exterior_cw=False)
     else:
-        return topo_simpl_gdf.geometry.array.to_numpy()
+        # shapely.orient_polygons is only available from shapely 2.1
+        geoms_simpl = np.array([_orient(geom) for geom in geoms_simpl], dtype=object)
+
+    return geoms_simpl, [feature["id"] for feature in features]
+
+
+def _orient(geom: BaseGeometry) -> BaseGeometry:
+    """Orient (multi)polygons with the exterior counter-clockwise, holes clockwise."""
+    if geom.is_empty:
+        return geom
+    if isinstance(geom, shapely.Polygon):
+        return shapely.geometry.polygon.orient(geom, sign=1.0)
+    if isinstance(geom, shapely.MultiPolygon):
+        return shapely.MultiPolygon(
+            [shapely.geometry.polygon.orient(poly, sign=1.0) for poly in geom.geoms]
+        )
+    return geom
@@ -1,5 +1,6 @@
 import enum
 import math
+from typing import Optional
 
 import shapely
 
@@ -75,25 +76,10 @@ class GeometryType(enum.Enum):
     @property
     def empty(self) -> str:
         """Get an empty geometry instance of this type."""
-        base_wkb_id = self.value % 1000
-        if base_wkb_id == 1:
-            return shapely.Point()
-        elif base_wkb_id == 2:
-            return shapely.LineString()
-        elif base_wkb_id == 3:
-            return shapely.Polygon()
-        elif base_wkb_id == 4:
-            return shapely.MultiPoint()
-        elif base_wkb_id == 5:
-            return shapely.MultiLineString()
-        elif base_wkb_id == 6:
-            return shapely.MultiPolygon()
-        elif base_wkb_id == 7:
-            return shapely.GeometryCollection()
-        elif base_wkb_id == 0:
-            return shapely.GeometryCollection()
-        else:
+        empty_type = _EMPTY_TYPES.get(self.value % 1000)
+        if empty_type is None:
             raise ValueError(f"No empty implemented for {self}")
+        return empty_type()
 
     @property
     def flatten(self):
@@ -120,19 +106,7 @@ class GeometryType(enum.Enum):
     @property
     def name_camelcase(self) -> str:
         """Get the name in camel case."""
-        name_result = self.name
-        name_result = name_result.replace("MISSING", "Missing")
-        name_result = name_result.replace("MULTI", "Multi")
-        name_result = name_result.replace("POINT", "Point")
-        name_result = name_result.replace("POLYGON", "Polygon")
-        name_result = name_result.replace("LINESTRING", "LineString")
-        name_result = name_result.replace("GEOMETRY", "Geometry")
-        name_result = name_result.replace("COLLECTION", "Collection")
-        name_result = name_result.replace("TRIANGLE", "Triangle")
-        name_result = name_result.replace("POLYHEDRALSURFACE", "PolyhedralSurface")
-        # name_result = name_result.replace("TIN", "TIN")
-
-        return name_result
+        return _GEOMETRYTYPE_NAMES_CAMELCASE[self]
 
     @property
     def is_multitype(self):
@@ -145,46 +119,26 @@ class GeometryType(enum.Enum):
     @property
     def to_multitype(self):
         """Get the corresponding multitype."""
-        if self.is_multitype:
-            return self
-        elif self.value % 1000 in (1, 2, 3):
-            # For the "standard" types, point, polygon and linestring, return multi
-            return GeometryType(self.value + 3)
-        elif self == GeometryType.MISSING:
+        multitype = _GEOMETRYTYPE_MULTITYPES[self]
+        if multitype is None:
             raise ValueError(f"No multitype implemented for {self}")
-        else:
-            # For all other types, return GeometryCollection
-            return GeometryType(self.value - self.value % 1000 + 7)
+        return multitype
 
     @property
     def to_singletype(self):
         """Get the corresponding single type."""
-        base_wkb_id = self.value % 1000
-        if base_wkb_id in (0, 1, 2, 3):
-            # It is already single type
-            return self
-        elif base_wkb_id in (4, 5, 6):
-            # For the "standard" types, point, polygon and linestring, return single
-            return GeometryType(self.value - 3)
-        elif base_wkb_id == 7:
-            return GeometryType.GEOMETRY
-        else:
+        singletype = _GEOMETRYTYPE_SINGLETYPES[self]
+        if singletype is None:
             raise ValueError(f"No singletype implemented for {self}")
+        return singletype
 
     @property
     def to_primitivetype(self):
         """Get the corresponding primitive type."""
-        base_wkb_id = self.value % 1000
-        if base_wkb_id in (1, 4):
-            return PrimitiveType.POINT
-        elif base_wkb_id in (2, 5):
-            return PrimitiveType.LINESTRING
-        elif base_wkb_id in (3, 6):
-            return PrimitiveType.POLYGON
-        elif base_wkb_id in (0, 7):
-            return PrimitiveType.GEOMETRY
-        else:
+        primitivetype = _PRIMITIVETYPES.get(self.value % 1000)
+        if primitivetype is None:
             raise ValueError(f"No primitivetype implemented for {self}")
+        return primitivetype
 
 
 class PrimitiveType(enum.Enum):
@@ -206,39 +160,110 @@ class PrimitiveType(enum.Enum):
     @property
     def dimensions(self) -> int:
         """Get the number of dimensions of the type."""
-        if self is PrimitiveType.POINT:
-            return 0
-        elif self is PrimitiveType.LINESTRING:
-            return 1
-        elif self is PrimitiveType.POLYGON:
-            return 2
-        else:
+        dimensions = _PRIMITIVETYPE_DIMENSIONS.get(self)
+        if dimensions is None:
             raise ValueError(f"no dimensions implemented for {self}")
+        return dimensions
 
     @property
     def to_multitype(self) -> GeometryType:
         """Get the corresponding multitype."""
-        if self is PrimitiveType.POINT:
-            return GeometryType.MULTIPOINT
-        elif self is PrimitiveType.LINESTRING:
-            return GeometryType.MULTILINESTRING
-        elif self is PrimitiveType.POLYGON:
-            return GeometryType.MULTIPOLYGON
-        elif self is PrimitiveType.GEOMETRY:
-            return GeometryType.GEOMETRYCOLLECTION
-        else:
-            raise ValueError(f"No multitype implemented for {self}")
+        return _PRIMITIVETYPE_MULTITYPES[self]
 
     @property
     def to_singletype(self) -> GeometryType:
         """Get the corresponding multitype."""
-        if self is PrimitiveType.POINT:
-            return GeometryType.POINT
-        elif self is PrimitiveType.LINESTRING:
-            return GeometryType.LINESTRING
-        elif self is PrimitiveType.POLYGON:
-            return GeometryType.POLYGON
-        elif self is PrimitiveType.GEOMETRY:
-            return GeometryType.GEOMETRY
-        else:
-            raise ValueError(f"No singletype implemented for {self}")
+        return _PRIMITIVETYPE_SINGLETYPES[self]
+
+
+def _name_camelcase(geometrytype: GeometryType) -> str:
+    name_result = geometrytype.name
+    name_result = name_result.replace("MISSING", "Missing")
+    name_result = name_result.replace("MULTI", "Multi")
+    name_result = name_result.replace("POINT", "Point")
+    name_result = name_result.replace("POLYGON", "Polygon")
+    name_result = name_result.replace("LINESTRING", "LineString")
+    name_result = name_result.replace("GEOMETRY", "Geometry")
+    name_result = name_result.replace("COLLECTION", "Collection")
+    name_result = name_result.replace("TRIANGLE", "Triangle")
+    name_result = name_result.replace("POLYHEDRALSURFACE", "PolyhedralSurface")
+    # name_result = name_result.replace("TIN", "TIN")
+
+    return name_result
+
+
+def _multitype(geometrytype: GeometryType) -> Optional[GeometryType]:
+    if geometrytype.is_multitype:
+        return geometrytype
+    elif geometrytype.value % 1000 in (1, 2, 3):
+        # For the "standard" types, point, polygon and linestring, return multi
+        return GeometryType(geometrytype.value + 3)
+    elif geometrytype == GeometryType.MISSING:
+        return None
+    else:
+        # For all other types, return GeometryCollection
+        return GeometryType(geometrytype.value - geometrytype.value % 1000 + 7)
+
+
+def _singletype(geometrytype: GeometryType) -> Optional[GeometryType]:
+    base_wkb_id = geometrytype.value % 1000
+    if base_wkb_id in (0, 1, 2, 3):
+        # It is already single type
+        return geometrytype
+    elif base_wkb_id in (4, 5, 6):
+        # For the "standard" types, point, polygon and linestring, return single
+        return GeometryType(geometrytype.value - 3)
+    elif base_wkb_id == 7:
+        return GeometryType.GEOMETRY
+    else:
+        return None
+
+
+# Lookup tables for the properties of the types, so they only need to be determined
+# once. The tables on the base wkb id are valid for all Z/M variants of the types.
+_EMPTY_TYPES = {
+    0: shapely.GeometryCollection,
+    1: shapely.Point,
+    2: shapely.LineString,
+    3: shapely.Polygon,
+    4: shapely.MultiPoint,
+    5: shapely.MultiLineString,
+    6: shapely.MultiPolygon,
+    7: shapely.GeometryCollection,
+}
+_PRIMITIVETYPES = {
+    0: PrimitiveType.GEOMETRY,
+    1: PrimitiveType.POINT,
+    2: PrimitiveType.LINESTRING,
+    3: PrimitiveType.POLYGON,
+    4: PrimitiveType.POINT,
+    5: PrimitiveType.LINESTRING,
+    6: PrimitiveType.POLYGON,
+    7: PrimitiveType.GEOMETRY,
+}
+_GEOMETRYTYPE_NAMES_CAMELCASE = {
+    geometrytype: _name_camelcase(geometrytype) for geometrytype in GeometryType
+}
+_GEOMETRYTYPE_MULTITYPES = {
+    geometrytype: _multitype(geometrytype) for geometrytype in GeometryType
+}
+_GEOMETRYTYPE_SINGLETYPES = {
+    geometrytype: _singletype(geometrytype) for geometrytype in GeometryType
+}
+_PRIMITIVETYPE_DIMENSIONS = {
+    PrimitiveType.POINT: 0,
+    PrimitiveType.LINESTRING: 1,
+    PrimitiveType.POLYGON: 2,
+}
+_PRIMITIVETYPE_MULTITYPES = {
+    PrimitiveType.POINT: GeometryType.MULTIPOINT,
+    PrimitiveType.LINESTRING: GeometryType.MULTILINESTRING,
+    PrimitiveType.POLYGON: GeometryType.MULTIPOLYGON,
+    PrimitiveType.GEOMETRY: GeometryType.GEOMETRYCOLLECTION,
+}
+_PRIMITIVETYPE_SINGLETYPES = {
+    PrimitiveType.POINT: GeometryType.POINT,
+    PrimitiveType.LINESTRING: GeometryType.LINESTRING,
+    PrimitiveType.POLYGON: GeometryType.POLYGON,
+    PrimitiveType.GEOMETRY: GeometryType.GEOMETRY,
+}
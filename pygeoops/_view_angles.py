@@ -1,11 +1,30 @@
-import math
+from typing import Optional
 
 import numpy as np
+from numpy.typing import NDArray
 import shapely
 import shapely.geometry
+from shapely.geometry.base import BaseGeometry
 
 from pygeoops._general import _extract_0dim_ndarray
 
+# Length of the lines used to check if a visible geometry crosses a certain angle.
+_LINE_LENGTH = 5000000
+# Offset of the lines just south and north of the 0° line.
+_TOLERANCE = 0.0000000001
+# Coordinates of the rays used to check if a visible geometry crosses a certain angle,
+# relative to the viewpoint: the 0° line, the lines just south and north of the 0° line
+# and the 180° line.
+_RAYS = np.array(
+    [
+        [[0, 0], [_LINE_LENGTH, 0]],
+        [[0, -_TOLERANCE], [_LINE_LENGTH, -_TOLERANCE]],
+        [[0, _TOLERANCE], [_LINE_LENGTH, _TOLERANCE]],
+        [[0, 0], [-_LINE_LENGTH, 0]],
+    ],
+    dtype=np.float64,
+)
+
 
 def view_angles(
     viewpoint,
@@ -45,50 +64,116 @@ def view_angles(
     visible_geom_is_arr = hasattr(visible_geom, "__len__")
     viewpoint_is_arr = hasattr(viewpoint, "__len__")
     if not visible_geom_is_arr and not viewpoint_is_arr:
+        _validate_input(viewpoint, visible_geom)
         return _view_angles(viewpoint, visible_geom)
 
     # At least one of the inputs is arraylike, so prepare input arrays
+    # Remark: a scalar input is broadcasted to a read-only view instead of a copy.
     if viewpoint_is_arr:
-        viewpoint_arr = np.array(viewpoint)
+        viewpoint_arr = np.asarray(viewpoint)
     else:
-        viewpoint_arr = np.full(len(visible_geom), viewpoint)
+        viewpoint_arr = np.broadcast_to(
+            np.asarray(viewpoint, dtype=object), (len(visible_geom),)
+        )
     if visible_geom_is_arr:
-        visible_geom_arr = np.array(visible_geom)
+        visible_geom_arr = np.asarray(visible_geom)
     else:
-        visible_geom_arr = np.full(len(viewpoint), visible_geom)
+        visible_geom_arr = np.broadcast_to(
+            np.asarray(visible_geom, dtype=object), (len(viewpoint),)
+        )
 
     if len(viewpoint_arr) != len(visible_geom_arr):
         raise ValueError(
             "viewpoint and visible_geom are arrays, so they must be the same length"
         )
 
-    # Combine both input arrays
-    geoms_arr = np.concatenate(
-        [
-            np.expand_dims(viewpoint_arr, 1),
-            np.expand_dims(visible_geom_arr, 1),
-        ],
-        axis=1,
+    return _view_angles_arr(viewpoint_arr, visible_geom_arr)
+
+
+def _view_angles_arr(
+    viewpoint_arr: NDArray[BaseGeometry], visible_geom_arr: NDArray[BaseGeometry]
+) -> NDArray[np.float64]:
+    """
+    Returns the start and end angles how the visible_geoms can be seen from viewpoints.
+
+    The angles are calculated in bulk for all viewpoint/visible_geom pairs. Only the
+    pairs where the visible_geom crosses the 0° angle are calculated one by one.
+
+    Args:
+        viewpoint_arr (NDArray[BaseGeometry]): the points being viewed from.
+        visible_geom_arr (NDArray[BaseGeometry]): the visible geometries to calculate
+            the view angles to. Should have the same length as viewpoint_arr.
+
+    Returns:
+        NDArray[np.float64]: array with for each viewpoint/visible_geom pair the start
+            angle and end angle in degrees. Values are between 0 and 360, or np.nan
+            for None or empty geometries.
+    """
+    _validate_input_arr(viewpoint_arr, visible_geom_arr)
+
+    # To make it easy to calculate the angles, treat the viewpoints as the origin
+    # of the coordinate system.
+    nb_pairs = len(viewpoint_arr)
+    viewpoint_coords = shapely.get_coordinates(viewpoint_arr)
+    visible_coords, visible_coords_idx = shapely.get_coordinates(
+        visible_geom_arr, return_index=True
+    )
+    visible_coords = visible_coords - viewpoint_coords[visible_coords_idx]
+
+    # Calculate + convert to 0-360°
+    # Remark: the conversions are done in place to avoid temporary arrays.
+    angles_arr = np.arctan2(visible_coords[:, 1], visible_coords[:, 0])
+    np.rad2deg(angles_arr, out=angles_arr)
+    np.add(angles_arr, 360, out=angles_arr, where=angles_arr < 0)
+
+    # Check which visible geometries cross the 0° line. For those, the angles need to
+    # be determined in more detail.
+    nb_coords = np.bincount(visible_coords_idx, minlength=nb_pairs)
+    has_coords = nb_coords > 0
+    intersects_0 = (
+        np.bincount(visible_coords_idx, weights=angles_arr == 0, minlength=nb_pairs) > 0
+    )
+    # Remark: the 0° lines are created starting from the viewpoints, so the visible
+    # geometries don't need to be translated. Only check intersects if the bounds
+    # intersect, as this is a lot cheaper.
+    lines_0_coords = viewpoint_coords[:, np.newaxis] + _RAYS[0]
+    to_check = (
+        has_coords
+        & ~intersects_0
+        & _bounds_intersect(
+            shapely.bounds(visible_geom_arr),
+            np.concatenate([lines_0_coords[:, 0], lines_0_coords[:, 1]], axis=1),
+        )
+    )
+    intersects_0[to_check] = shapely.intersects(
+        visible_geom_arr[to_check], shapely.linestrings(lines_0_coords[to_check])
     )
 
-    # Function to calculate the view angles for one viewpoint, visible_geom pair
-    def calculate_angles(input) -> tuple[float, float]:
-        viewpoint_geom, visible_geom = input
-        return _view_angles(viewpoint_geom, visible_geom)
+    # If a visible geom doesn't intersect the 0 angle, it is easy
+    result = np.full((nb_pairs, 2), np.nan)
+    coords_starts = (np.cumsum(nb_coords) - nb_coords)[has_coords]
+    result[has_coords, 0] = np.minimum.reduceat(angles_arr, coords_starts)
+    result[has_coords, 1] = np.maximum.reduceat(angles_arr, coords_starts)
 
-    # Calculate angles for all elements
-    angles_arr = np.apply_along_axis(
-        calculate_angles,
-        arr=geoms_arr,
-        axis=1,
+    # Calculate the other ones one by one, but check the other rays in bulk
+    idxs = np.flatnonzero(intersects_0)
+    intersects_rays = _intersects_rays(
+        visible_geom_arr[idxs], viewpoint_coords[idxs], _RAYS[1:]
     )
+    for idx, intersects_rays_cur in zip(idxs, intersects_rays.tolist()):
+        result[idx] = _view_angles(
+            viewpoint_arr[idx],
+            visible_geom_arr[idx],
+            intersects_rays=[True, *intersects_rays_cur],
+        )
 
-    return angles_arr
+    return result
 
 
 def _view_angles(
     viewpoint: shapely.Point,
     visible_geom: shapely.Geometry,
+    intersects_rays: Optional[list[bool]] = None,
 ) -> tuple[float, float]:
     """
     Returns the start and end angle how the visible_geom can be seen from the viewpoint.
@@ -96,72 +181,86 @@ def _view_angles(
     Remark: the start angle can be larger than the end angle. E.g. if the visible geom
     is located in the south east of the viewpoint till the north east.
 
+    The input is not validated, so this should be done before calling this function.
+
     Args:
         viewpoint (Geometry): the point that is being viewed from.
         visible_geom (Geometry): the visible geometry to calculate the
             view angles to. Only single-type geometries are supported.
+        intersects_rays (list[bool], optional): if already known, for each of the
+            rays in _RAYS whether the visible_geom intersects it. Defaults to None.
 
     Returns:
         Tuple[float, float]: the start angle and end angle for the viewpoint in degrees.
         Values are between 0 and 360, or np.nan if no visible_geom.
     """
-    if not isinstance(viewpoint, shapely.Point):
-        raise ValueError("viewpoint should be a point")
-    if isinstance(visible_geom, shapely.geometry.base.BaseMultipartGeometry):
-        raise ValueError("visible_geom can't be a multipart geometry")
-
     # Prepare the viewpoint
     viewpoint_coords_arr = shapely.get_coordinates(viewpoint)
-    if len(viewpoint_coords_arr) != 1:
-        raise ValueError(
-            f"viewpoint should have one coordinate, not {len(viewpoint_coords_arr)}"
-        )
     viewpoint_x = viewpoint_coords_arr[0][0]
     viewpoint_y = viewpoint_coords_arr[0][1]
 
-    # To make it easy to calculate the angles, treat the viewpoint as the origin
-    # of the coordinate system.
-    def subtract_viewpoint(coords):
-        return np.column_stack([coords[:, 0] - viewpoint_x, coords[:, 1] - viewpoint_y])
-
-    visible_geom = shapely.transform(visible_geom, subtract_viewpoint)
-
     # Get visible coordinates
     visible_coords_arr = shapely.get_coordinates(visible_geom)
     if len(visible_coords_arr) == 0:
         return (np.nan, np.nan)
 
+    # To make it easy to calculate the angles, treat the viewpoint as the origin
+    # of the coordinate system.
+    # Remark: translating the visible geom is relatively expensive, so only the
+    # coordinates are translated. The lines to check intersections with are created
+    # relative to the viewpoint instead.
+    x = visible_coords_arr[:, 0] - viewpoint_x
+    y = visible_coords_arr[:, 1] - viewpoint_y
+
     # Calculate + convert to 0-360°
-    x = visible_coords_arr[:, 0]
-    y = visible_coords_arr[:, 1]
-    angles_arr = np.rad2deg(np.arctan2(y, x))
-    angles_arr = np.where(angles_arr < 0, angles_arr + 360, angles_arr)
+    # Remark: room is reserved to add the 360°, 0° and 180° angles if needed.
+    nb_angles = len(x)
+    angles_buffer = np.empty(nb_angles + 3)
+    angles_arr = angles_buffer[:nb_angles]
+    np.arctan2(y, x, out=angles_arr)
+    np.rad2deg(angles_arr, out=angles_arr)
+    np.add(angles_arr, 360, out=angles_arr, where=angles_arr < 0)
+
+    # A point is only visible in a single direction
+    if isinstance(visible_geom, shapely.Point):
+        return (angles_arr[0], angles_arr[0])
 
     # Check if the visible geometry crosses the 0° line, to make sure angles 0
     # and/or 360 are present if needed
-    line_length = 5000000
-    if len(angles_arr[angles_arr == 0]) > 0:
-        intersects_0 = True
-    else:
-        line_0 = shapely.linestrings([[[0, 0], [line_length, 0]]])
-        intersects_0 = shapely.intersects(visible_geom, line_0).tolist()[0]
-
-    # If visible geom doesn't intersect the 0 angle, it is easy
-    if not intersects_0:
-        return (angles_arr.min(), angles_arr.max())
+    if intersects_rays is None:
+        if (angles_arr == 0).any():
+            intersects_0 = True
+        else:
+            intersects_0 = _intersects(
+                visible_geom,
+                shapely.bounds(visible_geom).tolist(),
+                (viewpoint_coords_arr[0] + _RAYS[0]).tolist(),
+            )
+
+        # If visible geom doesn't intersect the 0 angle, it is easy
+        if not intersects_0:
+            return (angles_arr.min(), angles_arr.max())
+
+        # Check the other rays at once
+        intersects_rays = [
+            True,
+            *_intersects_rays(
+                np.array([visible_geom]), viewpoint_coords_arr, _RAYS[1:]
+            )[0].tolist(),
+        ]
+    _, intersects_south_0, intersects_north_0, intersects_180 = intersects_rays
 
     # If visible geom doesn't pass 0 angle to south, it is still easy
-    tol = 0.0000000001
-    line_SE = shapely.linestrings([[[0, -tol], [line_length, -tol]]])
-    if not shapely.intersects(visible_geom, line_SE):
+    if not intersects_south_0:
         return (angles_arr.min(), angles_arr.max())
     else:
         # Add 360° angle
-        angles_arr = np.append(angles_arr, 360)
+        angles_buffer[nb_angles] = 360
+        nb_angles += 1
+        angles_arr = angles_buffer[:nb_angles]
 
     # If visible geom doesn't pass 0 angle to north, still not difficult
-    line_NE = shapely.linestrings([[[0, tol], [line_length, tol]]])
-    if not shapely.intersects(visible_geom, line_NE):
+    if not intersects_north_0:
         # Remove 0 angle if there are still other angles
         angles_nonzero_arr = angles_arr[angles_arr != 0]
         if len(angles_nonzero_arr) > 0:
@@ -169,39 +268,204 @@ def _view_angles(
             return (angles_nonzero_arr.min(), angles_nonzero_arr.max())
     else:
         # 0° should be in angles_arr
-        angles_arr = np.append(angles_arr, 0)
-
-    line_180 = shapely.linestrings([[[0, 0], [-line_length, 0]]])
-    intersects_180 = shapely.intersects(visible_geom, line_180).tolist()[0]
+        angles_buffer[nb_angles] = 0
+        nb_angles += 1
+        angles_arr = angles_buffer[:nb_angles]
 
     # If visible geom doesn't pass 180° angle, return result
     if not intersects_180:
-        angle_N_max = angles_arr[angles_arr <= 180].max()
-        angle_S_min = angles_arr[angles_arr >= 180].min()
+        angle_N_max = angles_arr.max(where=angles_arr <= 180, initial=-np.inf)
+        angle_S_min = angles_arr.min(where=angles_arr >= 180, initial=np.inf)
         return (angle_S_min, angle_N_max)
     else:
         # 180° should be in angles_arr
-        angles_arr = np.append(angles_arr, 180)
-
-    # It's not clear if/where the geom starts or ends, so "brute-force" search an
-    # angle where the geom is not "visible" from the viewpoint.
-    # TODO: review code
-    angle_prev = None
-    for angle in np.sort(angles_arr):
-        if angle_prev is None or angle == angle_prev:
-            angle_prev = angle
-            continue
-
-        # Check if the geom is visible between both angles
-        angle_avg = (angle + angle_prev) / 2
-        x = line_length * math.cos(angle_avg)
-        y = line_length * math.sin(angle_avg)
-        line_avg = shapely.linestrings([[[0, 0], [x, y]]])
-        intersects_avg = shapely.intersects(visible_geom, line_avg).tolist()[0]
-        if not intersects_avg:
-            return (angle_prev, angle)
-
-        angle_prev = angle
+        angles_buffer[nb_angles] = 180
+        nb_angles += 1
+        angles_arr = angles_buffer[:nb_angles]
+
+    # It's not clear if/where the geom starts or ends, so search the first range
+    # between the angles where the geom is not "visible" from the viewpoint.
+    # Remark: no range can be partly visible, so determining which ranges are covered
+    # by the segments of the geom is a lot faster than checking intersects per range.
+    if isinstance(visible_geom, shapely.Polygon):
+        rings_nb_coords = shapely.get_num_coordinates(shapely.get_rings(visible_geom))
+    else:
+        rings_nb_coords = np.array([len(x)])
+    angles_range = _first_angles_range_not_covered(x, y, rings_nb_coords, angles_arr)
+    if angles_range is not None:
+        return angles_range
+
+    # The viewpoint is on the visible geom, so "brute-force" search an angle where the
+    # geom is not "visible" from the viewpoint: check the middle of all ranges between
+    # the sorted angles at once.
+    # Remark: the visible geom was already prepared to check the rays.
+    angles_unique = np.unique(angles_arr)
+    angles_avg = np.deg2rad((angles_unique[:-1] + angles_unique[1:]) / 2)
+    lines_coords = np.empty((len(angles_avg), 2, 2))
+    lines_coords[:, 0] = (viewpoint_x, viewpoint_y)
+    lines_coords[:, 1, 0] = viewpoint_x + _LINE_LENGTH * np.cos(angles_avg)
+    lines_coords[:, 1, 1] = viewpoint_y + _LINE_LENGTH * np.sin(angles_avg)
+    intersects_avg = shapely.intersects(visible_geom, shapely.linestrings(lines_coords))
+    if not intersects_avg.all():
+        idx = np.argmin(intersects_avg)
+        return (angles_unique[idx], angles_unique[idx + 1])
 
     # If no angle found where the geom is not visible, it must be all around
     return (0.0, 360.0)
+
+
+def _first_angles_range_not_covered(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    rings_nb_coords: NDArray[np.int64],
+    angles_arr: NDArray[np.float64],
+) -> Optional[tuple[float, float]]:
+    """
+    Returns the first range between the sorted angles not covered by any segment.
+
+    Args:
+        x (NDArray[np.float64]): the x coordinates, relative to the viewpoint.
+        y (NDArray[np.float64]): the y coordinates, relative to the viewpoint.
+        rings_nb_coords (NDArray[np.int64]): the number of coordinates of each ring or
+            line the coordinates consist of.
+        angles_arr (NDArray[np.float64]): the angles of the coordinates + the 0°, 180°
+            and 360° angles.
+
+    Returns:
+        Optional[tuple[float, float]]: the first range not covered, (0.0, 360.0) if all
+            ranges are covered or None if a segment touches the viewpoint.
+    """
+    # Determine the segments, but not between the last and first coordinate of rings
+    segment_mask = np.ones(len(x) - 1, dtype=bool)
+    segment_mask[np.cumsum(rings_nb_coords)[:-1] - 1] = False
+    x1, y1 = x[:-1][segment_mask], y[:-1][segment_mask]
+    x2, y2 = x[1:][segment_mask], y[1:][segment_mask]
+    start_angles = angles_arr[: len(x) - 1][segment_mask]
+    end_angles = angles_arr[1 : len(x)][segment_mask]
+
+    # If a segment touches the viewpoint, the geom is visible in all directions.
+    cross = x1 * y2 - y1 * x2
+    if ((cross == 0) & (x1 * x2 + y1 * y2 <= 0)).any():
+        return None
+
+    # Each segment covers the ranges counterclockwise from its first to its last angle.
+    # Segments pointing to the viewpoint don't cover any range.
+    sweeps = cross != 0
+    counterclockwise = cross[sweeps] > 0
+    first_angles = np.where(counterclockwise, start_angles[sweeps], end_angles[sweeps])
+    last_angles = np.where(counterclockwise, end_angles[sweeps], start_angles[sweeps])
+
+    # Count per range how many segments cover it, via the changes in the count at the
+    # first and last angles of the segments. Segments passing 0° cover the ranges from
+    # their first angle till 360° and from 0° till their last angle.
+    angles_unique = np.unique(angles_arr)
+    nb_covering_changes = np.zeros(len(angles_unique), dtype=np.int64)
+    np.add.at(nb_covering_changes, np.searchsorted(angles_unique, first_angles), 1)
+    np.add.at(nb_covering_changes, np.searchsorted(angles_unique, last_angles), -1)
+    nb_passing_0 = np.count_nonzero(first_angles > last_angles)
+    nb_covering_changes[0] += nb_passing_0
+    nb_covering_changes[-1] -= nb_passing_0
+    not_covered_idxs = np.flatnonzero(np.cumsum(nb_covering_changes)[:-1] == 0)
+    if len(not_covered_idxs) == 0:
+        return (0.0, 360.0)
+
+    idx = not_covered_idxs[0]
+    return (angles_unique[idx], angles_unique[idx + 1])
+
+
+def _validate_input(viewpoint: shapely.Point, visible_geom: shapely.Geometry):
+    """Raises a ValueError if the input for a view angles calculation is invalid."""
+    if not isinstance(viewpoint, shapely.Point):
+        raise ValueError("viewpoint should be a point")
+    if isinstance(visible_geom, shapely.geometry.base.BaseMultipartGeometry):
+        raise ValueError("visible_geom can't be a multipart geometry")
+    nb_coords = shapely.get_num_coordinates(viewpoint)
+    if nb_coords != 1:
+        raise ValueError(f"viewpoint should have one coordinate, not {nb_coords}")
+
+
+def _validate_input_arr(
+    viewpoint_arr: NDArray[BaseGeometry], visible_geom_arr: NDArray[BaseGeometry]
+):
+    """
+    Raises a ValueError if the input for a view angles calculation is invalid.
+
+    The types of all viewpoint/visible_geom pairs are checked in bulk. For the first
+    invalid pair, the same error is raised as _validate_input raises.
+    """
+    is_invalid = (
+        (shapely.get_type_id(viewpoint_arr) != shapely.GeometryType.POINT)
+        | (shapely.get_type_id(visible_geom_arr) >= shapely.GeometryType.MULTIPOINT)
+        | (shapely.get_num_coordinates(viewpoint_arr) != 1)
+    )
+    if is_invalid.any():
+        idx = np.flatnonzero(is_invalid)[0]
+        _validate_input(viewpoint_arr[idx], visible_geom_arr[idx])
+
+
+def _intersects(
+    geom: shapely.Geometry, geom_bounds: list[float], line_coords: list[list[float]]
+) -> bool:
+    """
+    Returns True if the geom intersects the line with the coordinates specified.
+
+    The bounds are checked first, as this is a lot cheaper than intersects.
+    """
+    minx, miny, maxx, maxy = geom_bounds
+    (x1, y1), (x2, y2) = line_coords
+    if (
+        minx > max(x1, x2)
+        or maxx < min(x1, x2)
+        or miny > max(y1, y2)
+        or maxy < min(y1, y2)
+    ):
+        return False
+    return bool(shapely.intersects(geom, shapely.linestrings(line_coords)))
+
+
+def _intersects_rays(
+    geoms: NDArray[BaseGeometry],
+    viewpoint_coords: NDArray[np.float64],
+    rays: NDArray[np.float64],
+) -> NDArray[np.bool_]:
+    """
+    Returns for each geom whether it intersects the rays starting from its viewpoint.
+
+    Args:
+        geoms (NDArray[BaseGeometry]): the geometries to check.
+        viewpoint_coords (NDArray[np.float64]): the coordinates of the viewpoint for
+            each geom.
+        rays (NDArray[np.float64]): the coordinates of the rays, relative to the
+            viewpoint.
+
+    Returns:
+        NDArray[np.bool_]: for each geom and each ray whether they intersect.
+    """
+    rays_coords = (viewpoint_coords[:, np.newaxis, np.newaxis] + rays).reshape(-1, 2, 2)
+    geoms_repeated = np.repeat(geoms, len(rays))
+
+    # Only check intersects if the bounds intersect, as this is a lot cheaper.
+    to_check = _bounds_intersect(
+        np.repeat(shapely.bounds(geoms), len(rays), axis=0),
+        np.concatenate([rays_coords.min(axis=1), rays_coords.max(axis=1)], axis=1),
+    )
+    # Remark: prepare the geoms, as they can be checked for intersects several times.
+    shapely.prepare(geoms[to_check.reshape(len(geoms), len(rays)).any(axis=1)])
+    intersects = np.zeros(len(geoms_repeated), dtype=bool)
+    intersects[to_check] = shapely.intersects(
+        geoms_repeated[to_check], shapely.linestrings(rays_coords[to_check])
+    )
+
+    return intersects.reshape(len(geoms), len(rays))
+
+
+def _bounds_intersect(
+    bounds1: NDArray[np.float64], bounds2: NDArray[np.float64]
+) -> NDArray[np.bool_]:
+    """Returns True for the bounds in bounds1 that intersect the ones in bounds2."""
+    return (
+        (bounds1[..., 0] <= bounds2[..., 2])
+        & (bounds1[..., 2] >= bounds2[..., 0])
+        & (bounds1[..., 1] <= bounds2[..., 3])
+        & (bounds1[..., 3] >= bounds2[..., 1])
+    )
@@ -20,6 +20,9 @@ RUNS_LOCAL = True
 if "GITHUB_ACTIONS" in os.environ:
     RUNS_LOCAL = False
 
+# Set the environment variable PYGEOOPS_PLOT=1 to plot the results of the tests
+PLOT = os.environ.get("PYGEOOPS_PLOT", "0") not in ("", "0")
+
 
 class TestData:
     crs_epsg = 31370
@@ -72,8 +75,8 @@ def plot(
     title: Optional[str] = None,
     clean_name: bool = True,
 ):
-    # If we are running on CI server, don't plot
-    if "GITHUB_ACTIONS" in os.environ:
+    # Only plot if explicitly asked for, as plotting takes most of the test time
+    if not PLOT:
         return
 
     figure = mpl_figure.Figure()
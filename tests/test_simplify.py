@@ -155,6 +155,57 @@ def test_simplify_input_geometries(input_type):
         assert len(simplified_line.coords) == 2
 
 
+@pytest.mark.parametrize("preserve_topology", [True, False])
+def test_simplify_input_geometries_mixed(preserve_topology):
+    """
+    Test simplify of an array of mixed geometry types, some of which are simplified in
+    batch. The result should be the same as simplifying them one by one.
+    """
+    # Prepare test data
+    input = np.array(
+        [
+            shapely.LineString([(0, 0), (10, 10), (20, 20)]),
+            shapely.Polygon([(0, 0), (0, 10), (1, 10), (10, 10), (10, 0), (0, 0)]),
+            None,
+            shapely.LineString([(0, 0, 1), (10, 10, 2), (20, 20, 3)]),
+            shapely.Point(0, 0),
+            shapely.LineString([(0, 0), (0, 0.5), (0, 0)]),
+            shapely.MultiLineString([[(0, 0), (10, 10), (20, 20)], [(0, 5), (5, 5)]]),
+            shapely.Polygon(
+                [(0, 0, 1), (0, 10, 1), (1, 10, 1), (10, 10, 1), (0, 0, 1)]
+            ),
+        ]
+    )
+
+    # Run test
+    result = pygeoops.simplify(
+        geometry=input,
+        algorithm="lang",
+        tolerance=1,
+        preserve_topology=preserve_topology,
+    )
+
+    # Check result
+    assert isinstance(result, np.ndarray)
+    assert len(result) == len(input)
+    for geom, geom_simplified in zip(input, result):
+        expected = pygeoops.simplify(
+            geometry=geom,
+            algorithm="lang",
+            tolerance=1,
+            preserve_topology=preserve_topology,
+        )
+        if expected is None:
+            assert geom_simplified is None
+        else:
+            assert geom_simplified.equals_exact(expected, tolerance=0)
+    assert len(result[0].coords) == 2
+    assert shapely.has_z(result[3])
+    # Polygons with and without z should keep their dimension
+    assert not shapely.has_z(result[1])
+    assert shapely.has_z(result[7])
+
+
 @pytest.mark.parametrize("preserve_common_boundaries", [True, False])
 def test_simplify_input_geoseries(preserve_common_boundaries: bool):
     """Test simplify of a geoseries of linestrings."""
@@ -251,6 +302,27 @@ def test_simplify_invalid_geometry():
     assert len(geom_simplified.geoms) == 3
 
 
+@pytest.mark.parametrize("input_type", ["geometry", "ndarray"])
+def test_simplify_invalid_geometry_collapsed(input_type: str):
+    """
+    If an invalid polygon collapses and the topology is preserved, the original polygon
+    is returned, but made valid.
+    """
+    bowtie = shapely.Polygon([(0, 0), (10, 10), (10, 0), (0, 10), (0, 0)])
+    if input_type == "ndarray":
+        result = pygeoops.simplify(np.array([bowtie]), algorithm="lang", tolerance=20)
+        assert isinstance(result, np.ndarray)
+        geom_simplified = result[0]
+    else:
+        geom_simplified = pygeoops.simplify(bowtie, algorithm="lang", tolerance=20)
+
+    assert geom_simplified is not None
+    assert geom_simplified.is_valid
+    assert isinstance(geom_simplified, shapely.MultiPolygon)
+    assert len(geom_simplified.geoms) == 2
+    assert geom_simplified.area == 50
+
+
 def test_simplify_invalid_params():
     with pytest.raises(ValueError, match="Unsupported algorithm specified: invalid"):
         pygeoops.simplify(
@@ -372,3 +444,20 @@ def test_simplify_preservetopology(algorithm, tolerance):
         preserve_topology=False,
     )
     assert geom_simplified is None
+
+
+def test_make_valid_polygons():
+    # Prepare test data
+    bowtie = shapely.Polygon([(0, 0), (10, 10), (10, 0), (0, 10), (0, 0)])
+    collapsed = shapely.Polygon([(0, 0), (10, 0), (20, 0), (0, 0)])
+    geometries = np.array([bowtie, collapsed])
+
+    # Run test
+    result = pygeoops._simplify._make_valid_polygons(geometries)
+
+    # Check result
+    assert len(result) == 2
+    assert isinstance(result[0], shapely.MultiPolygon)
+    assert len(result[0].geoms) == 2
+    assert result[0].area == 50
+    assert result[1] is None
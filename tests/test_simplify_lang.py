@@ -81,3 +81,55 @@ def test_simplify_coords_lang_idx_input_types(input_type):
         assert isinstance(idx_to_keep, np.ndarray)
     assert len(idx_to_keep) < len(coords)
     assert len(idx_to_keep) == 2
+
+
+@pytest.mark.parametrize("simplify_lookahead_points", [False, True])
+def test_simplify_coords_lang_idx_large_window(simplify_lookahead_points):
+    """
+    With a large window the distances are checked vectorized, so test this as well.
+    """
+    # Prepare test data: a V-shape with many collinear points on both legs
+    coords = [(x, 0) for x in range(26)] + [(25 + x, x) for x in range(1, 26)]
+
+    # Run test
+    idx_to_keep = simplify_lang.simplify_coords_lang_idx(
+        coords=np.asarray(coords, dtype=float),
+        tolerance=0.5,
+        lookahead=-1,
+        simplify_lookahead_points=simplify_lookahead_points,
+    )
+
+    # Check result
+    assert idx_to_keep.tolist() == [0, 25, 50]
+
+
+@pytest.mark.parametrize("simplify_lookahead_points", [False, True])
+@pytest.mark.parametrize("lookahead", [-1, 3, 8])
+def test_simplify_coords_lang_numba(lookahead, simplify_lookahead_points):
+    """
+    The numba compiled implementation should give the same result as the python one.
+    """
+    _ = pytest.importorskip("numba")
+
+    # Prepare test data
+    rng = np.random.default_rng(seed=0)
+    coords = np.cumsum(rng.normal(size=(500, 2)), axis=0)
+    xs = np.ascontiguousarray(coords[:, 0])
+    ys = np.ascontiguousarray(coords[:, 1])
+    window_size = len(coords) - 1 if lookahead == -1 else lookahead
+
+    # Run test
+    idx_to_keep = simplify_lang._simplify_coords_lang_idx(
+        xs,
+        ys,
+        tolerance=1.0,
+        window_size=window_size,
+        simplify_lookahead_points=simplify_lookahead_points,
+    )
+    idx_to_keep_numba = simplify_lang._simplify_coords_lang_idx_compiled(
+        xs, ys, 1.0, window_size, simplify_lookahead_points
+    )
+
+    # Check result
+    assert len(idx_to_keep) < len(coords)
+    assert idx_to_keep.tolist() == idx_to_keep_numba.tolist()
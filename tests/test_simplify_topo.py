@@ -3,7 +3,9 @@ import geopandas as gpd
 import numpy as np
 import pytest
 import shapely
+import topojson
 
+import pygeoops
 from pygeoops import _simplify_topo as simplify_topo
 import test_helper
 
@@ -137,6 +139,29 @@ def test_simplify_topo_GeometryCollection():
         assert type(geom_input) == type(geom_result)
 
 
+@pytest.mark.parametrize("input_type", ["ndarray", "list"])
+def test_simplify_topo_linestrings(input_type):
+    """
+    Test with LineStrings as input -> only LineStrings should be returned.
+    """
+    # Prepare test data
+    line1 = shapely.LineString([(0, 0), (5, 0.1), (10, 0)])
+    line2 = shapely.LineString([(10, 0), (15, 0.1), (20, 0)])
+    input = [line1, line2]
+    if input_type == "ndarray":
+        input = np.array(input)
+
+    # Test
+    result = simplify_topo.simplify_topo(input, tolerance=1, algorithm="lang")
+
+    # Check result
+    assert result is not None
+    assert isinstance(result, np.ndarray)
+    assert len(result) == len(input)
+    assert result[0] == shapely.LineString([(0, 0), (10, 0)])
+    assert result[1] == shapely.LineString([(10, 0), (20, 0)])
+
+
 def test_simplify_topo_mixedtypes():
     """
     Test with a list of mixed geometry types as input -> so no extraction of a specific
@@ -257,3 +282,132 @@ def test_simplify_topo_result_GeometryCollection(tmp_path):
             )
         elif idx == 1:
             assert geom_result.normalize() == poly.normalize()
+
+
+@pytest.mark.parametrize("algorithm", ["lang", "lang+", "vw"])
+def test_simplify_topo_parallel(monkeypatch, algorithm):
+    """
+    Simplifying the arcs in parallel should give the same result as sequentially.
+    """
+    # Skip test for algorithms that needs simplification lib when it is not available
+    if algorithm in ["rdp", "vw"]:
+        _ = pytest.importorskip("simplification")
+
+    # Prepare test data
+    grid = shapely.segmentize(pygeoops.create_grid2((0, 0, 50, 50), 16), 0.7)
+    keep_points_on = shapely.box(0, 0, 25, 25)
+    expected = simplify_topo.simplify_topo(
+        grid, tolerance=1, algorithm=algorithm, keep_points_on=keep_points_on
+    )
+
+    # Test
+    monkeypatch.setattr(simplify_topo, "_MIN_ARCS_PARALLEL", 1)
+    monkeypatch.setattr(simplify_topo, "_MIN_ARCS_PER_BATCH", 1)
+    monkeypatch.setattr(simplify_topo.os, "cpu_count", lambda: 4)
+    result = simplify_topo.simplify_topo(
+        grid, tolerance=1, algorithm=algorithm, keep_points_on=keep_points_on
+    )
+
+    # Check result
+    assert result is not None
+    assert isinstance(result, np.ndarray)
+    assert len(result) == len(grid)
+    assert shapely.equals_exact(result, expected, tolerance=0).all()
+
+
+def test_simplify_topo_disjoint():
+    """
+    If the input geometries don't intersect, no topology is needed and the result is
+    the same as for a normal simplify.
+    """
+    # Prepare test data
+    poly1 = shapely.Polygon([(0, 0), (10, 0), (10, 10), (5, 10.5), (0, 10), (0, 0)])
+    poly2 = shapely.Polygon([(20, 0), (30, 0), (30, 10), (25, 9.5), (20, 10), (20, 0)])
+    input = gpd.GeoSeries([poly1, poly2], index=[3, 5], crs=31370)
+
+    # Test
+    result = simplify_topo.simplify_topo(input, tolerance=1, algorithm="lang")
+
+    # Check result
+    assert isinstance(result, gpd.GeoSeries)
+    assert result.crs == input.crs
+    assert result.index.tolist() == input.index.tolist()
+    expected = pygeoops.simplify(input.values, tolerance=1, algorithm="lang")
+    assert result.tolist() == expected.tolist()
+    assert len(result[3].exterior.coords) == 5
+
+
+@pytest.mark.parametrize("orient_polygons_available", [True, False])
+def test_topology_to_geometries(monkeypatch, orient_polygons_available: bool):
+    """
+    Reconstructing the geometries from the topology directly should give the same
+    result as via `Topology.to_gdf`.
+    """
+    # Prepare test data
+    input = gpd.GeoSeries.from_wkt(
+        [
+            "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0), (2 2, 4 2, 4 4, 2 2))",
+            "MULTIPOLYGON (((10 0, 20 0, 20 10, 10 10, 10 0)), "
+            "((30 0, 31 0, 31 1, 30 0)))",
+            "LINESTRING (0 0, 5 -5, 10 0)",
+            "MULTILINESTRING ((0 -10, 10 -10), (20 -10, 20 -20))",
+            "POLYGON EMPTY",
+        ],
+        index=[3, 5, 6, 8, 9],
+        crs=31370,
+    )
+    topo = topojson.Topology(input, prequantize=False)
+
+    expected = topo.to_gdf().geometry
+
+    # Test
+    if not orient_polygons_available:
+        # shapely.orient_polygons is only available from shapely 2.1
+        monkeypatch.delattr(shapely, "orient_polygons", raising=False)
+    result = simplify_topo._topology_to_geometries(topo)
+
+    # Check result
+    assert result is not None
+    result_geoms, result_index = result
+    assert isinstance(result_geoms, np.ndarray)
+    assert result_index == expected.index.tolist()
+    assert shapely.to_wkb(result_geoms).tolist() == expected.to_wkb().tolist()
+
+
+def test_topology_to_geometries_unsupported():
+    """Topologies containing e.g. points are not supported."""
+    topo = topojson.Topology(
+        [shapely.Point(0, 0), shapely.box(0, 0, 1, 1)], prequantize=False
+    )
+    assert simplify_topo._topology_to_geometries(topo) is None
+
+
+def test_simplify_topo_no_arcs():
+    """If the topology doesn't contain any arcs, the input is returned."""
+    input = [shapely.MultiPoint([(0, 0), (1, 1), (2, 2)]), shapely.Point(0, 0)]
+    result = simplify_topo.simplify_topo(input, tolerance=1)
+    assert result.tolist() == input
+
+
+def test_simplify_topo_max_2_coords(monkeypatch):
+    """
+    If no input geometry has more than 2 coordinates, nothing can be simplified so no
+    topology is created.
+    """
+    # Prepare test data
+    input = [
+        shapely.LineString([(0, 0), (10, 10)]),
+        shapely.LineString([(0, 10), (10, 0)]),
+        shapely.Point(5, 5),
+    ]
+
+    def topology_error(*args, **kwargs):
+        raise AssertionError("no topology should be created")
+
+    monkeypatch.setattr(simplify_topo.topojson, "Topology", topology_error)
+
+    # Test
+    result = simplify_topo.simplify_topo(input, tolerance=1)
+
+    # Check result
+    assert result.tolist() == input
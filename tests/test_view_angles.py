@@ -69,6 +69,12 @@ def get_testdata() -> (
             "POLYGON((-1 1, -1 -1, 1 -1, 1 0, 2 -2, -2 -2, -1 1))",
         ],
         ["SE, y!=0", 270.0, 315.0, "POLYGON((1 -1, 0 -1, 0 -2, 1 -1))"],
+        [
+            "SW>SE_<360",
+            225.0,
+            315.0,
+            "POLYGON((-1 -1, -1 1, 1 1, 1 -1, 2 -2, 2 2, -2 2, -2 -2, -1 -1))",
+        ],
         ["SE, y=0", 315.0, 360.0, "POLYGON((1 0, 1 -1, 2 -1, 2 0, 1 0))"],
         [
             "SW>NW",
@@ -156,3 +162,9 @@ def test_view_angles_geometries(input_type):
     assert isinstance(angles_arr, np.ndarray)
     exp_angles_arr = np.full((len(viewpoint_arr), 2), expected_angles[3])
     assert np.array_equal(angles_arr, exp_angles_arr, equal_nan=True)
+
+
+def test_view_angles_geometries_empty():
+    angles_arr = pygeoops.view_angles(shapely.Point(0, 0), [])
+    assert isinstance(angles_arr, np.ndarray)
+    assert angles_arr.shape == (0, 2)